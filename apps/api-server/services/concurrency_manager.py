@@ -7,7 +7,7 @@ import asyncio
 import logging
 from typing import Optional
 
-from src.core.pipeline import create_pipeline_components
+from src.core.pipeline import close_pipeline_components, create_pipeline_components
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +109,14 @@ class PipelinePool:
     async def cleanup(self):
         """Cleanup all pipeline instances"""
         logger.info("Cleaning up pipeline pool...")
-        # Add cleanup logic if needed
+        for instance in self.pool:
+            try:
+                await close_pipeline_components(
+                    instance["main_agent_tool_manager"],
+                    instance["sub_agent_tool_managers"],
+                )
+            except Exception as e:
+                logger.error(f"Failed to close pipeline instance {instance['id']}: {e}")
         self.pool.clear()
         self._initialized = False
 
@@ -15,7 +15,11 @@ from hydra import compose, initialize_config_dir
 from omegaconf import DictConfig
 from prompt_patch import apply_prompt_patch
 from src.config.settings import expose_sub_agents_as_tools
-from src.core.pipeline import create_pipeline_components, execute_task_pipeline
+from src.core.pipeline import (
+    close_pipeline_components,
+    create_pipeline_components,
+    execute_task_pipeline,
+)
 from utils import replace_chinese_punctuation
 
 # Apply custom system prompt patch (adds MiroThinker identity)
@@ -1732,4 +1736,14 @@ if __name__ == "__main__":
     demo = build_demo()
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8080"))
-    demo.queue().launch(server_name=host, server_port=port)
+    try:
+        demo.queue().launch(server_name=host, server_port=port)
+    finally:
+        # Stop the MCP servers kept open for the preloaded tool managers
+        if _preload_cache["loaded"]:
+            asyncio.run(
+                close_pipeline_components(
+                    _preload_cache["main_agent_tool_manager"],
+                    _preload_cache["sub_agent_tool_managers"],
+                )
+            )
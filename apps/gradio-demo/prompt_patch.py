@@ -147,9 +147,11 @@ def _patch_system_prompt():
     # Store original function
     original_generate_mcp_system_prompt = prompt_utils.generate_mcp_system_prompt
 
-    def patched_generate_mcp_system_prompt(date, mcp_servers):
+    def patched_generate_mcp_system_prompt(date, mcp_servers, **kwargs):
         """Patched version that prepends custom identity prompt."""
-        original_prompt = original_generate_mcp_system_prompt(date, mcp_servers)
+        original_prompt = original_generate_mcp_system_prompt(
+            date, mcp_servers, **kwargs
+        )
         return CUSTOM_IDENTITY_PROMPT + original_prompt
 
     # Apply patches to all modules that import and use this function
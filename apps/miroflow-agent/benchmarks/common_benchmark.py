@@ -19,15 +19,14 @@ import hydra
 from evaluators.eval_utils import verify_answer_for_datasets
 from omegaconf import DictConfig, OmegaConf
 from src.core.pipeline import (
+    close_pipeline_components,
     create_pipeline_components,
     execute_task_pipeline,
 )
 from src.logging.summary_time_cost import generate_summary
 from src.utils.prompt_utils import (
-    FAILURE_EXPERIENCE_FOOTER,
-    FAILURE_EXPERIENCE_HEADER,
-    FAILURE_EXPERIENCE_ITEM,
     FORMAT_ERROR_MESSAGE,
+    format_failure_experiences,
 )
 
 
@@ -80,6 +79,12 @@ def _task_worker(task_dict, cfg_dict, evaluator_kwargs):
         # Convert result to dict for serialization
         return asdict(result)
     finally:
+        # The worker process is reused for later tasks: stop this task's MCP servers
+        loop.run_until_complete(
+            close_pipeline_components(
+                evaluator.main_agent_tool_manager, evaluator.sub_agent_tool_managers
+            )
+        )
         loop.close()
 
 
@@ -332,15 +337,9 @@ class BenchmarkEvaluator(ABC):
 
                         # Rebuild enhanced task description with recovered failure experiences
                         if failure_experiences:
-                            current_task_description += FAILURE_EXPERIENCE_HEADER
-                            for idx, exp in enumerate(failure_experiences, 1):
-                                current_task_description += (
-                                    FAILURE_EXPERIENCE_ITEM.format(
-                                        attempt_number=idx,
-                                        failure_summary=exp,
-                                    )
-                                )
-                            current_task_description += FAILURE_EXPERIENCE_FOOTER
+                            current_task_description += format_failure_experiences(
+                                failure_experiences
+                            )
                             print(
                                 f"    Recovered {len(failure_experiences)} failure experience(s) from previous retries"
                             )
@@ -388,21 +387,11 @@ class BenchmarkEvaluator(ABC):
 
                                         # Build enhanced task description with accumulated failure experiences
                                         # Start fresh from original task_description each time
-                                        current_task_description = task_description
-                                        current_task_description += (
-                                            FAILURE_EXPERIENCE_HEADER
-                                        )
-                                        for idx, exp in enumerate(
-                                            failure_experiences, 1
-                                        ):
-                                            current_task_description += (
-                                                FAILURE_EXPERIENCE_ITEM.format(
-                                                    attempt_number=idx,
-                                                    failure_summary=exp,
-                                                )
+                                        current_task_description = (
+                                            task_description
+                                            + format_failure_experiences(
+                                                failure_experiences
                                             )
-                                        current_task_description += (
-                                            FAILURE_EXPERIENCE_FOOTER
                                         )
 
                                         print(
@@ -8,6 +8,7 @@ from omegaconf import DictConfig, OmegaConf
 
 # Import from the new modular structure
 from src.core.pipeline import (
+    close_pipeline_components,
     create_pipeline_components,
     execute_task_pipeline,
 )
@@ -33,16 +34,22 @@ async def amain(cfg: DictConfig) -> None:
     task_file_name = ""
 
     # Execute task using the pipeline
-    final_summary, log_file_path, _ = await execute_task_pipeline(
-        cfg=cfg,
-        task_id=task_id,
-        task_file_name=task_file_name,
-        task_description=task_description,
-        main_agent_tool_manager=main_agent_tool_manager,
-        sub_agent_tool_managers=sub_agent_tool_managers,
-        output_formatter=output_formatter,
-        log_dir=cfg.debug_dir,
-    )
+    try:
+        final_summary, log_file_path, _ = await execute_task_pipeline(
+            cfg=cfg,
+            task_id=task_id,
+            task_file_name=task_file_name,
+            task_description=task_description,
+            main_agent_tool_manager=main_agent_tool_manager,
+            sub_agent_tool_managers=sub_agent_tool_managers,
+            output_formatter=output_formatter,
+            log_dir=cfg.debug_dir,
+        )
+    finally:
+        # Shut down the MCP server sessions kept open across tool calls
+        await close_pipeline_components(
+            main_agent_tool_manager, sub_agent_tool_managers
+        )
 
 
 @hydra.main(config_path="conf", config_name="config", version_base=None)
@@ -4,13 +4,18 @@
 """MiroFlow Agent - A modular agent framework for task execution."""
 
 from .core.orchestrator import Orchestrator
-from .core.pipeline import create_pipeline_components, execute_task_pipeline
+from .core.pipeline import (
+    close_pipeline_components,
+    create_pipeline_components,
+    execute_task_pipeline,
+)
 from .io.output_formatter import OutputFormatter
 from .llm.factory import ClientFactory
 from .logging.task_logger import TaskLog, bootstrap_logger
 
 __all__ = [
     "Orchestrator",
+    "close_pipeline_components",
     "create_pipeline_components",
     "execute_task_pipeline",
     "OutputFormatter",
@@ -5,7 +5,11 @@
 
 from .answer_generator import AnswerGenerator
 from .orchestrator import Orchestrator
-from .pipeline import create_pipeline_components, execute_task_pipeline
+from .pipeline import (
+    close_pipeline_components,
+    create_pipeline_components,
+    execute_task_pipeline,
+)
 from .stream_handler import StreamHandler
 from .tool_executor import ToolExecutor
 
@@ -14,6 +18,7 @@ __all__ = [
     "Orchestrator",
     "StreamHandler",
     "ToolExecutor",
+    "close_pipeline_components",
     "create_pipeline_components",
     "execute_task_pipeline",
 ]
@@ -27,10 +27,15 @@ from ..llm.base_client import BaseClient
 from ..logging.task_logger import TaskLog, get_utc_plus_8_time
 from ..utils.parsing_utils import extract_llm_response_text
 from ..utils.prompt_utils import (
+    DESCRIBE_TOOL_NAME,
+    TOOL_CATALOG_SERVER_NAME,
+    contains_mcp_tags,
+    describe_tool,
+    find_mcp_tags,
+    find_refusal_keywords,
     generate_agent_specific_system_prompt,
     generate_agent_summarize_prompt,
-    mcp_tags,
-    refusal_keywords,
+    is_refusal,
 )
 from .answer_generator import AnswerGenerator
 from .stream_handler import StreamHandler
@@ -156,6 +161,8 @@ class Orchestrator:
 
         # Context management settings
         self.context_compress_limit = cfg.agent.get("context_compress_limit", 0)
+        # List only tool names in system prompts; schemas are fetched via describe_tool
+        self.lazy_tool_schemas = cfg.agent.get("lazy_tool_schemas", False)
         self.tool_executor = ToolExecutor(
             main_agent_tool_manager=main_agent_tool_manager,
             sub_agent_tool_managers=sub_agent_tool_managers,
@@ -210,7 +217,8 @@ class Orchestrator:
             Tuple of (should_continue, should_break, turn_count, consecutive_rollbacks, message_history)
         """
         # Check for MCP tags in response (format error)
-        if any(mcp_tag in assistant_response_text for mcp_tag in mcp_tags):
+        matched_tags = find_mcp_tags(assistant_response_text)
+        if matched_tags:
             if consecutive_rollbacks < self.MAX_CONSECUTIVE_ROLLBACKS - 1:
                 turn_count -= 1
                 consecutive_rollbacks += 1
@@ -219,7 +227,7 @@ class Orchestrator:
                 self.task_log.log_step(
                     "warning",
                     f"{agent_name} | Turn: {turn_count} | Rollback",
-                    f"Tool call format incorrect - found MCP tags in response. "
+                    f"Tool call format incorrect - found MCP tags in response: {matched_tags}. "
                     f"Consecutive rollbacks: {consecutive_rollbacks}/{self.MAX_CONSECUTIVE_ROLLBACKS}, "
                     f"Total attempts: {total_attempts}/{max_attempts}",
                 )
@@ -233,10 +241,8 @@ class Orchestrator:
                 return False, True, turn_count, consecutive_rollbacks, message_history
 
         # Check for refusal keywords
-        if any(keyword in assistant_response_text for keyword in refusal_keywords):
-            matched_keywords = [
-                kw for kw in refusal_keywords if kw in assistant_response_text
-            ]
+        matched_keywords = find_refusal_keywords(assistant_response_text)
+        if matched_keywords:
             if consecutive_rollbacks < self.MAX_CONSECUTIVE_ROLLBACKS - 1:
                 turn_count -= 1
                 consecutive_rollbacks += 1
@@ -331,6 +337,34 @@ class Orchestrator:
             self.used_queries.setdefault(cache_name, defaultdict(int))
             self.used_queries[cache_name][query_str] += 1
 
+    def _describe_tool_call(
+        self, tool_definitions: List[Dict[str, Any]], tool_name: str, arguments: dict
+    ) -> Dict[str, Any]:
+        """Answer a lazy tool-catalog call from the loaded tool definitions."""
+        tool_result = {
+            "server_name": TOOL_CATALOG_SERVER_NAME,
+            "tool_name": tool_name,
+        }
+        if tool_name != DESCRIBE_TOOL_NAME:
+            tool_result["error"] = (
+                f"Tool '{tool_name}' not found on server '{TOOL_CATALOG_SERVER_NAME}'."
+            )
+            return tool_result
+
+        definition = describe_tool(
+            tool_definitions,
+            arguments.get("server_name"),
+            arguments.get("tool_name"),
+        )
+        if definition is None:
+            tool_result["error"] = (
+                f"Unknown tool '{arguments.get('tool_name')}' on server "
+                f"'{arguments.get('server_name')}'."
+            )
+        else:
+            tool_result["result"] = definition
+        return tool_result
+
     async def run_sub_agent(
         self,
         sub_agent_name: str,
@@ -382,6 +416,7 @@ class Orchestrator:
         system_prompt = self.llm_client.generate_agent_system_prompt(
             date=date.today(),
             mcp_servers=tool_definitions,
+            lazy=self.lazy_tool_schemas,
         ) + generate_agent_specific_system_prompt(agent_type=sub_agent_name)
 
         # Limit sub-agent turns
@@ -477,12 +512,9 @@ class Orchestrator:
                 if should_continue:
                     continue
                 if should_break_loop:
-                    if not any(
-                        mcp_tag in assistant_response_text for mcp_tag in mcp_tags
-                    ) and not any(
-                        keyword in assistant_response_text
-                        for keyword in refusal_keywords
-                    ):
+                    if not contains_mcp_tags(
+                        assistant_response_text
+                    ) and not is_refusal(assistant_response_text):
                         self.task_log.log_step(
                             "info",
                             f"{sub_agent_name} | Turn: {turn_count} | LLM Call",
@@ -541,9 +573,14 @@ class Orchestrator:
                     tool_call_id = await self.stream.tool_call(tool_name, arguments)
 
                     # Execute tool call
-                    tool_result = await self.sub_agent_tool_managers[
-                        sub_agent_name
-                    ].execute_tool_call(server_name, tool_name, arguments)
+                    if server_name == TOOL_CATALOG_SERVER_NAME:
+                        tool_result = self._describe_tool_call(
+                            tool_definitions, tool_name, arguments
+                        )
+                    else:
+                        tool_result = await self.sub_agent_tool_managers[
+                            sub_agent_name
+                        ].execute_tool_call(server_name, tool_name, arguments)
 
                     # Update query count if successful
                     if "error" not in tool_result:
@@ -823,6 +860,7 @@ class Orchestrator:
         system_prompt = self.llm_client.generate_agent_system_prompt(
             date=date.today(),
             mcp_servers=tool_definitions,
+            lazy=self.lazy_tool_schemas,
         ) + generate_agent_specific_system_prompt(agent_type="main")
         system_prompt = system_prompt.strip()
 
@@ -915,12 +953,9 @@ class Orchestrator:
                 if should_continue:
                     continue
                 if should_break_loop:
-                    if not any(
-                        mcp_tag in assistant_response_text for mcp_tag in mcp_tags
-                    ) and not any(
-                        keyword in assistant_response_text
-                        for keyword in refusal_keywords
-                    ):
+                    if not contains_mcp_tags(
+                        assistant_response_text
+                    ) and not is_refusal(assistant_response_text):
                         self.task_log.log_step(
                             "info",
                             f"Main Agent | Turn: {turn_count} | LLM Call",
@@ -1021,13 +1056,18 @@ class Orchestrator:
                         tool_call_id = await self.stream.tool_call(tool_name, arguments)
 
                         # Execute tool call
-                        tool_result = (
-                            await self.main_agent_tool_manager.execute_tool_call(
-                                server_name=server_name,
-                                tool_name=tool_name,
-                                arguments=arguments,
+                        if server_name == TOOL_CATALOG_SERVER_NAME:
+                            tool_result = self._describe_tool_call(
+                                tool_definitions, tool_name, arguments
+                            )
+                        else:
+                            tool_result = (
+                                await self.main_agent_tool_manager.execute_tool_call(
+                                    server_name=server_name,
+                                    tool_name=tool_name,
+                                    arguments=arguments,
+                                )
                             )
-                        )
 
                         # Update query count if successful
                         if "error" not in tool_result:
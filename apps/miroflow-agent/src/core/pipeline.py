@@ -7,6 +7,7 @@ Task execution pipeline module.
 This module provides:
 - execute_task_pipeline: Main function to run a complete task from start to finish
 - create_pipeline_components: Factory function to initialize all pipeline components
+- close_pipeline_components: Close the tool sessions held by those components
 
 The pipeline orchestrates the interaction between LLM clients, tool managers,
 and the orchestrator to execute complex multi-turn agent tasks.
@@ -99,6 +100,9 @@ async def execute_task_pipeline(
         "info", "Main | Task Context", f"[track_id={task_id}] Full context length: {len(task_description)} chars"
     )
 
+    # Citation indices only need to be consistent within a single task
+    output_formatter.reset()
+
     # Set task_log for all ToolManager instances
     main_agent_tool_manager.set_task_log(task_log)
     if sub_agent_tool_managers:
@@ -152,11 +156,6 @@ async def execute_task_pipeline(
             task_id=task_id,
         )
 
-        if llm_client:
-            llm_client.close()
-        if summary_llm_client:
-            summary_llm_client.close()
-
         task_log.status = "success"
 
         # Store failure experience summary in task log if available
@@ -197,6 +196,11 @@ async def execute_task_pipeline(
         return error_message, "", log_file_path, None
 
     finally:
+        # Release the LLM clients' HTTP connections, also when the task failed
+        for client in (llm_client, summary_llm_client):
+            if client:
+                await client.aclose()
+
         task_log.end_time = get_utc_plus_8_time()
 
         # Record task summary to structured log
@@ -208,6 +212,19 @@ async def execute_task_pipeline(
         task_log.save()
 
 
+async def close_pipeline_components(main_agent_tool_manager, sub_agent_tool_managers):
+    """
+    Close the persistent tool sessions held by the pipeline's ToolManagers.
+
+    Args:
+        main_agent_tool_manager: The main agent's ToolManager
+        sub_agent_tool_managers: Dict mapping sub-agent names to their ToolManagers
+    """
+    await main_agent_tool_manager.aclose()
+    for sub_agent_tool_manager in (sub_agent_tool_managers or {}).values():
+        await sub_agent_tool_manager.aclose()
+
+
 def create_pipeline_components(cfg: DictConfig):
     """
     Creates and initializes the core components of the agent pipeline.
@@ -222,9 +239,12 @@ def create_pipeline_components(cfg: DictConfig):
     main_agent_mcp_server_configs, main_agent_blacklist = create_mcp_server_parameters(
         cfg, cfg.agent.main_agent
     )
+    # Optionally cache the tool definitions of stdio servers on disk across runs
+    tool_cache_dir = cfg.agent.get("tool_definitions_cache_dir", None)
     main_agent_tool_manager = ToolManager(
         main_agent_mcp_server_configs,
         tool_blacklist=main_agent_blacklist,
+        cache_dir=tool_cache_dir,
     )
 
     # Create OutputFormatter
@@ -242,6 +262,7 @@ def create_pipeline_components(cfg: DictConfig):
         sub_agent_tool_manager = ToolManager(
             sub_agent_mcp_server_configs,
             tool_blacklist=sub_agent_blacklist,
+            cache_dir=tool_cache_dir,
         )
         sub_agent_tool_managers[sub_agent] = sub_agent_tool_manager
 
@@ -221,8 +221,6 @@ class ToolExecutor:
         """
         # Handle scrape_and_extract_info: parse JSON and extract extracted_info
         if tool_name == "scrape_and_extract_info" and "result" in tool_call_result:
-            import json
-            import logging
             logger = logging.getLogger("miroflow")
             
             # Print raw result for debugging
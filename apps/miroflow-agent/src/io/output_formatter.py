@@ -6,11 +6,22 @@
 import json
 import logging
 import re
+from collections import deque
 from typing import Tuple
 
+logger = logging.getLogger("miroflow_agent")
+
 # Maximum length for tool results before truncation (100k chars ≈ 25k tokens)
 TOOL_RESULT_MAX_LENGTH = 100_000
 
+# Maximum number of URLs remembered for search result deduplication
+SEEN_URLS_MAX_SIZE = 10_000
+
+# Start of a \boxed{...} expression (whitespace allowed before the brace)
+_BOXED_START_PATTERN = re.compile(r"\\boxed\s*\{")
+# Tokens relevant to brace matching: escaped characters and raw braces
+_BOXED_TOKEN_PATTERN = re.compile(r"\\.|[{}]", re.DOTALL)
+
 
 class OutputFormatter:
     """Formatter for processing and formatting agent outputs."""
@@ -18,6 +29,20 @@ class OutputFormatter:
     def __init__(self):
         """Initialize OutputFormatter with URL deduplication state."""
         self.seen_urls = set()  # Track seen URLs for deduplication across searches
+        # Insertion order of seen_urls, used to evict the oldest URL when full
+        self._seen_urls_order = deque(maxlen=SEEN_URLS_MAX_SIZE)
+
+    def reset(self):
+        """Clear URL deduplication state at a task boundary."""
+        self.seen_urls.clear()
+        self._seen_urls_order.clear()
+
+    def _remember_url(self, link: str):
+        """Add a URL to seen_urls, evicting the oldest one once the cap is reached."""
+        if len(self._seen_urls_order) == self._seen_urls_order.maxlen:
+            self.seen_urls.discard(self._seen_urls_order[0])
+        self._seen_urls_order.append(link)
+        self.seen_urls.add(link)
 
     def format_tool_result_for_user(self, tool_call_execution_result: dict) -> dict:
         """
@@ -45,10 +70,12 @@ class OutputFormatter:
             # Provide the original output result of the tool
             content = tool_call_execution_result["result"]
             
-            # Add index numbers to search results for citation
+            # Add index numbers to search results for citation. This runs before
+            # truncation so that long results still get indices and seen_urls;
+            # the indexed text is short, since it keeps at most 10 results
             if tool_name in ["google_search", "sogou_search"]:
                 content = self._add_search_result_indices(content)
-            
+
             # Truncate overly long results to prevent context overflow
             if len(content) > TOOL_RESULT_MAX_LENGTH:
                 content = content[:TOOL_RESULT_MAX_LENGTH] + "\n... [Result truncated]"
@@ -79,10 +106,6 @@ class OutputFormatter:
         Duplicate URLs are skipped. These indices will match the frontend display indices.
         """
         try:
-            import json
-            import logging
-            logger = logging.getLogger("miroflow_agent")
-            
             data = json.loads(search_result_json)
             
             organic = data.get("organic", [])
@@ -105,7 +128,7 @@ class OutputFormatter:
                     continue
                 
                 # Add to seen URLs
-                self.seen_urls.add(link)
+                self._remember_url(link)
                 unique_count += 1
                 
                 # Format this result
@@ -129,10 +152,44 @@ class OutputFormatter:
             
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             # If parsing fails, return original content
-            import logging
-            logging.getLogger("miroflow_agent").warning(f"Failed to add search indices: {e}")
+            logger.warning(f"Failed to add search indices: {e}")
             return search_result_json
 
+    def _extract_boxed_content(self, text: str) -> str:
+        """
+        Extract the content of the last \\boxed{...} occurrence in the text.
+
+        Supports nested braces, escaped braces (\\{ and \\}) and whitespace
+        between \\boxed and the opening brace. Brace matching jumps between
+        regex matches instead of iterating character by character, so long
+        answers are scanned in C. If the expression is never closed, the
+        remainder of the text is returned as a fallback.
+
+        Returns:
+            The stripped boxed content, or an empty string if none is found.
+        """
+        if not text:
+            return ""
+
+        last_match = None
+        for last_match in _BOXED_START_PATTERN.finditer(text):
+            pass
+        if last_match is None:
+            return ""
+
+        start = last_match.end()
+        depth = 1
+        for token in _BOXED_TOKEN_PATTERN.finditer(text, start):
+            char = token.group()
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[start : token.start()].strip()
+
+        return text[start:].strip()
+
     def format_final_summary_and_log(
         self, final_answer_text: str, client=None
     ) -> Tuple[str, str]:
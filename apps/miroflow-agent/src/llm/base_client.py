@@ -8,9 +8,10 @@ This module defines the abstract base class and common utilities for LLM clients
 supporting both OpenAI and Anthropic API formats.
 """
 
-import asyncio
 import dataclasses
+import inspect
 from abc import ABC
+from collections import OrderedDict
 from typing import (
     Any,
     Dict,
@@ -23,11 +24,23 @@ from typing import (
 from omegaconf import DictConfig
 
 from ..logging.task_logger import TaskLog
-from .util import with_timeout
+from .util import get_encoding, with_timeout
 
 # Default timeout for LLM API calls (10 minutes)
 DEFAULT_LLM_TIMEOUT_SECONDS = 600
 
+# Maximum number of memoized token counts kept per client (LRU eviction)
+TOKEN_CACHE_MAX_SIZE = 512
+
+# Placeholder content for omitted tool results, shared across all messages.
+# Downstream code never mutates message content in place, so one instance is safe.
+_OMITTED_TOOL_RESULT_TEXT = "Tool result is omitted to save tokens."
+_OMITTED_ANTHROPIC = [{"type": "text", "text": _OMITTED_TOOL_RESULT_TEXT}]
+_OMITTED_OPENAI = _OMITTED_TOOL_RESULT_TEXT
+
+# Message roles that carry tool results (the first one is the initial task)
+_TOOL_RESULT_ROLES = frozenset({"user", "tool"})
+
 
 class TokenUsage(TypedDict, total=True):
     """
@@ -95,11 +108,21 @@ class BaseClient(ABC):
         self.max_tokens: int = self.cfg.llm.max_tokens
         self.async_client: bool = self.cfg.llm.async_client
         self.keep_tool_result: int = self.cfg.agent.keep_tool_result
+        # Omit old tool results in blocks of this size to keep the cached prompt prefix stable
+        self.keep_tool_result_stride: int = max(
+            1, self.cfg.agent.get("keep_tool_result_stride", 1)
+        )
         self.api_key: Optional[str] = self.cfg.llm.get("api_key")
         self.base_url: Optional[str] = self.cfg.llm.get("base_url")
         self.use_tool_calls: Optional[bool] = self.cfg.llm.get("use_tool_calls")
         self.repetition_penalty: float = self.cfg.llm.get("repetition_penalty", 1.0)
 
+        # Token counts memoized by text, see _count_tokens_cached
+        self._token_cache: "OrderedDict[str, int]" = OrderedDict()
+        # The summary prompt is fixed for a task, so its count is kept outside the LRU
+        self._summary_prompt_text: Optional[str] = None
+        self._summary_prompt_tokens: int = 0
+
         self.token_usage = self._reset_token_usage()
         self.client = self._create_client()
 
@@ -123,6 +146,50 @@ class BaseClient(ABC):
             total_cache_read_input_tokens=0,
         )
 
+    @staticmethod
+    def _content_text(content: Any) -> str:
+        """
+        Return the text of a message content for token estimation.
+
+        List (multi-part) content is reduced to its text fields instead of
+        being stringified as a whole, which would also count dict syntax.
+        """
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return "\n".join(
+                part.get("text", "") for part in content if isinstance(part, dict)
+            )
+        return str(content)
+
+    def _count_tokens_cached(self, text: str) -> int:
+        """
+        Count tokens with the shared tiktoken encoder, memoized by text.
+
+        The summary prompt and last user message are re-estimated on every
+        ReAct step, so repeated strings are served from a small LRU cache.
+        The text itself is the key: str hashes are cached, and equality is
+        only checked on a hash match, so lookups stay cheap and two strings
+        with colliding hashes never share a count.
+        """
+        cached = self._token_cache.get(text)
+        if cached is not None:
+            self._token_cache.move_to_end(text)
+            return cached
+
+        count = len(get_encoding("o200k_base").encode(text))
+        self._token_cache[text] = count
+        if len(self._token_cache) > TOKEN_CACHE_MAX_SIZE:
+            self._token_cache.popitem(last=False)
+        return count
+
+    def _estimate_summary_prompt_tokens(self, summary_prompt: str) -> int:
+        """Estimate tokens for the summary prompt, counting it once per distinct prompt."""
+        if self._summary_prompt_text != summary_prompt:
+            self._summary_prompt_tokens = self._estimate_tokens(summary_prompt)
+            self._summary_prompt_text = summary_prompt
+        return self._summary_prompt_tokens
+
     def _remove_tool_result_from_messages(
         self, messages, keep_tool_result
     ) -> List[Dict]:
@@ -133,9 +200,11 @@ class BaseClient(ABC):
             keep_tool_result: Number of tool results to keep. -1 means keep all.
 
         Returns:
-            List of messages with tool results filtered according to keep_tool_result
+            List of messages with tool results filtered according to keep_tool_result.
+            The list is new, but unchanged messages are shared with the input;
+            only omitted tool results are replaced with fresh dicts.
         """
-        messages_copy = [m.copy() for m in messages]
+        messages_copy = list(messages)
 
         if keep_tool_result == -1:
             # No processing needed, keep all messages
@@ -145,7 +214,7 @@ class BaseClient(ABC):
         user_indices = [
             i
             for i, msg in enumerate(messages_copy)
-            if msg.get("role") == "user" or msg.get("role") == "tool"
+            if msg.get("role") in _TOOL_RESULT_ROLES
         ]
 
         if len(user_indices) == 0:
@@ -181,6 +250,11 @@ class BaseClient(ABC):
         else:
             # Keep the last keep_tool_result tool results
             num_tool_results_to_keep = min(keep_tool_result, len(tool_result_indices))
+            # Omit older results only in whole strides. Every omission rewrites the
+            # message prefix and invalidates the provider's prompt cache, so with
+            # stride N the prefix changes once every N tool results instead of every step.
+            num_to_omit = len(tool_result_indices) - num_tool_results_to_keep
+            num_tool_results_to_keep += num_to_omit % self.keep_tool_result_stride
 
         # Get indices of tool results to keep from the end
         tool_result_indices_to_keep = (
@@ -202,22 +276,19 @@ class BaseClient(ABC):
         )
 
         # Replace content of tool results that should be omitted
-        for i, msg in enumerate(messages_copy):
-            if (
-                msg.get("role") == "user" or msg.get("role") == "tool"
-            ) and i not in indices_to_keep:
-                # Preserve the message structure but replace content
-                if isinstance(msg.get("content"), list):
-                    # For Anthropic format
-                    msg["content"] = [
-                        {
-                            "type": "text",
-                            "text": "Tool result is omitted to save tokens.",
-                        }
-                    ]
-                else:
-                    # For OpenAI format
-                    msg["content"] = "Tool result is omitted to save tokens."
+        # (user_indices already holds every user/tool message, so roles are not re-read)
+        kept_indices = set(indices_to_keep)
+        for i in user_indices:
+            if i in kept_indices:
+                continue
+            msg = messages_copy[i]
+            # Preserve the message structure but replace content (copy-on-write)
+            if isinstance(msg.get("content"), list):
+                # For Anthropic format
+                messages_copy[i] = {**msg, "content": _OMITTED_ANTHROPIC}
+            else:
+                # For OpenAI format
+                messages_copy[i] = {**msg, "content": _OMITTED_OPENAI}
 
         return messages_copy
 
@@ -305,29 +376,14 @@ class BaseClient(ABC):
                     tool_list.append(tool_def)
         return tool_list
 
-    def close(self):
-        """Close client connection.
-
-        Note: For async clients (AsyncOpenAI, AsyncAnthropic), the connection
-        will be closed when the client object is garbage collected.
-        For proper async cleanup, use `await client.aclose()` in an async context.
-        """
-        if hasattr(self.client, "close"):
-            if asyncio.iscoroutinefunction(self.client.close):
-                # For async clients, we cannot call close() synchronously.
-                # The async HTTP client will be closed when garbage collected.
-                # For explicit async cleanup, call aclose() from an async context.
-                if hasattr(self.client, "_client"):
-                    # Try to close the underlying httpx client if available
-                    try:
-                        self.client._client.close()
-                    except Exception:
-                        pass  # Ignore errors during cleanup
-            else:
-                self.client.close()
-        elif hasattr(self.client, "_client") and hasattr(self.client._client, "close"):
-            # Some clients may have internal _client attribute
-            self.client._client.close()
+    async def aclose(self) -> None:
+        """Close the provider client and its HTTP connections, sync or async."""
+        close = getattr(self.client, "close", None)
+        if close is None:
+            return
+        result = close()
+        if inspect.isawaitable(result):
+            await result
 
     def _format_response_for_log(self, response) -> Dict:
         """Format response for logging"""
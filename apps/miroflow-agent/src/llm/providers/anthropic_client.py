@@ -19,7 +19,6 @@ import dataclasses
 import logging
 from typing import Any, Dict, List, Tuple, Union
 
-import tiktoken
 from anthropic import (
     NOT_GIVEN,
     Anthropic,
@@ -29,6 +28,7 @@ from anthropic import (
 )
 from tenacity import retry, stop_after_attempt, wait_fixed
 
+from ...utils.parsing_utils import parse_llm_response_for_tool_calls
 from ...utils.prompt_utils import generate_mcp_system_prompt
 from ..base_client import BaseClient
 
@@ -126,42 +126,31 @@ class AnthropicClient(BaseClient):
         # Apply cache control
         processed_messages = self._apply_cache_control(messages_for_llm)
 
+        # The system prompt is identical across turns, so mark it as a cache
+        # breakpoint; the tool catalog it contains is then billed at the cached rate
+        request_params = {
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "top_p": self.top_p if self.top_p != 1.0 else NOT_GIVEN,
+            "top_k": self.top_k if self.top_k != -1 else NOT_GIVEN,
+            "max_tokens": self.max_tokens,
+            "system": [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            "messages": processed_messages,
+            "stream": False,
+        }
+
         try:
             # Note: Anthropic API does not support repetition_penalty parameter
             if self.async_client:
-                response = await self.client.messages.create(
-                    model=self.model_name,
-                    temperature=self.temperature,
-                    top_p=self.top_p if self.top_p != 1.0 else NOT_GIVEN,
-                    top_k=self.top_k if self.top_k != -1 else NOT_GIVEN,
-                    max_tokens=self.max_tokens,
-                    system=[
-                        {
-                            "type": "text",
-                            "text": system_prompt,
-                            "cache_control": {"type": "ephemeral"},
-                        }
-                    ],
-                    messages=processed_messages,
-                    stream=False,
-                )
+                response = await self.client.messages.create(**request_params)
             else:
-                response = self.client.messages.create(
-                    model=self.model_name,
-                    temperature=self.temperature,
-                    top_p=self.top_p if self.top_p != 1.0 else NOT_GIVEN,
-                    top_k=self.top_k if self.top_k != -1 else NOT_GIVEN,
-                    max_tokens=self.max_tokens,
-                    system=[
-                        {
-                            "type": "text",
-                            "text": system_prompt,
-                            "cache_control": {"type": "ephemeral"},
-                        }
-                    ],
-                    messages=processed_messages,
-                    stream=False,
-                )
+                response = self.client.messages.create(**request_params)
             self._update_token_usage(getattr(response, "usage", None))
             self.task_log.log_step(
                 "info",
@@ -237,8 +226,6 @@ class AnthropicClient(BaseClient):
         self, llm_response: Any, assistant_response_text: str
     ) -> List[Dict]:
         """Extract tool call information from LLM response"""
-        from ...utils.parsing_utils import parse_llm_response_for_tool_calls
-
         return parse_llm_response_for_tool_calls(assistant_response_text)
 
     def update_message_history(
@@ -246,13 +233,13 @@ class AnthropicClient(BaseClient):
     ) -> List[Dict]:
         """Update message history with tool calls data (llm client specific)"""
 
-        merged_text = "\n".join(
-            [
-                item[1]["text"]
-                for item in all_tool_results_content_with_id
-                if item[1]["type"] == "text"
-            ]
-        )
+        # Collect text parts once; unpacking avoids re-indexing each tuple
+        text_parts = [
+            result["text"]
+            for _, result in all_tool_results_content_with_id
+            if result["type"] == "text"
+        ]
+        merged_text = "\n".join(text_parts)
 
         message_history.append(
             {
@@ -263,21 +250,15 @@ class AnthropicClient(BaseClient):
 
         return message_history
 
-    def generate_agent_system_prompt(self, date: Any, mcp_servers: List[Dict]) -> str:
-        return generate_mcp_system_prompt(date, mcp_servers)
+    def generate_agent_system_prompt(
+        self, date: Any, mcp_servers: List[Dict], lazy: bool = False
+    ) -> str:
+        return generate_mcp_system_prompt(date, mcp_servers, lazy=lazy)
 
     def _estimate_tokens(self, text: str) -> int:
         """Use tiktoken to estimate the number of tokens in text"""
-        if not hasattr(self, "encoding"):
-            # Initialize tiktoken encoder
-            try:
-                self.encoding = tiktoken.get_encoding("o200k_base")
-            except Exception:
-                # If o200k_base is not available, use cl100k_base as fallback
-                self.encoding = tiktoken.get_encoding("cl100k_base")
-
         try:
-            return len(self.encoding.encode(text))
+            return self._count_tokens_cached(text)
         except Exception as e:
             # If encoding fails, use simple estimation: approximately 1 token per 4 characters
             self.task_log.log_step(
@@ -301,13 +282,17 @@ class AnthropicClient(BaseClient):
         buffer_factor = 1.5
 
         # Calculate token count for summary prompt
-        summary_tokens = int(self._estimate_tokens(str(summary_prompt)) * buffer_factor)
+        summary_tokens = int(
+            self._estimate_summary_prompt_tokens(summary_prompt) * buffer_factor
+        )
 
         # Calculate token count for the last user message in message_history
         last_user_tokens = 0
         if message_history[-1]["role"] == "user":
             content = message_history[-1]["content"]
-            last_user_tokens = int(self._estimate_tokens(str(content)) * buffer_factor)
+            last_user_tokens = int(
+                self._estimate_tokens(self._content_text(content)) * buffer_factor
+            )
 
         # Calculate total token count: last input + output + last user message + summary + reserved response space
         estimated_total = (
@@ -392,13 +377,14 @@ class AnthropicClient(BaseClient):
                 # Add ephemeral cache control to the text part of the last user message
                 new_content = []
                 processed_text = False
-                # Check if content is a list
-                if isinstance(turn["content"], str):
-                    turn["content"] = [{"type": "text", "text": turn["content"]}]
-                if isinstance(turn.get("content"), list):
+                # Check if content is a list (without mutating the shared message dict)
+                content = turn.get("content")
+                if isinstance(content, str):
+                    content = [{"type": "text", "text": content}]
+                if isinstance(content, list):
                     # see example here
                     # https://docs.anthropic.com/en/docs/build-with-claude/prompt-caching
-                    for item in turn["content"]:
+                    for item in content:
                         if (
                             item.get("type") == "text"
                             and len(item.get("text")) > 0
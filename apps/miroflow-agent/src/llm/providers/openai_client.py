@@ -15,38 +15,330 @@ Features:
 """
 
 import asyncio
+import atexit
 import dataclasses
+import importlib.util
 import logging
+import random
+import re
+import sys
+import threading
+import time
 import uuid
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import tiktoken
-from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+import httpx
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    AuthenticationError,
+    BadRequestError,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    InternalServerError,
+    NotFoundError,
+    OpenAI,
+    PermissionDeniedError,
+    RateLimitError,
+)
 
+from ...utils.parsing_utils import parse_llm_response_for_tool_calls
 from ...utils.prompt_utils import generate_mcp_system_prompt
-from ..base_client import BaseClient
+from ..base_client import DEFAULT_LLM_TIMEOUT_SECONDS, BaseClient
 
 logger = logging.getLogger("miroflow_agent")
 
+# Connection pool limits for the shared HTTP clients
+HTTP_CLIENT_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=300
+)
+# Fail fast on connect, but allow long generations to be read
+HTTP_CLIENT_TIMEOUT = httpx.Timeout(
+    DEFAULT_LLM_TIMEOUT_SECONDS, connect=5.0, write=30.0, pool=30.0
+)
+# HTTP/2 multiplexes concurrent requests over one connection; it needs the
+# optional `h2` package (httpx[http2]), so it is only enabled when available
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Retry backoff: min(max, base * 2**attempt) seconds plus up to 1s of jitter
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 60.0
+# Truncated responses may reflect server load, so their backoff starts higher
+LENGTH_RETRY_BASE_DELAY_SECONDS = 5.0
+# Default wall-clock budget for all retries of a single LLM call
+DEFAULT_RETRY_BUDGET_SECONDS = 180.0
+
+# Shared HTTP clients keyed by (base_url, async_client, event loop).
+# Sync clients live until interpreter exit. Async clients are bound to the loop
+# they were created in, so each loop gets its own, closed by the last
+# OpenAIClient.aclose() on that loop.
+_HttpClientKey = Tuple[Optional[str], bool, Optional[asyncio.AbstractEventLoop]]
+_HTTP_CLIENTS: Dict[_HttpClientKey, Union[httpx.AsyncClient, httpx.Client]] = {}
+# Number of OpenAIClient users of each shared async client
+_HTTP_CLIENT_USERS: Dict[_HttpClientKey, int] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+# Monotonic time until which requests to a base_url should wait after a 429.
+# Shared by all clients of the endpoint so concurrent tasks back off together.
+_RATE_LIMIT_COOLDOWN_UNTIL: Dict[Optional[str], float] = {}
+
+
+def _acquire_shared_http_client(
+    base_url: Optional[str], async_client: bool
+) -> Tuple[_HttpClientKey, Union[httpx.AsyncClient, httpx.Client]]:
+    """
+    Return a pooled HTTP client shared by all OpenAIClient instances with the
+    same endpoint, so warm connections are reused instead of re-handshaking.
+
+    Async clients are counted per user; pass the returned key to
+    _release_shared_http_client() once done with it.
+    """
+    loop = None
+    if async_client:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+    key = (base_url, async_client, loop)
+    with _HTTP_CLIENTS_LOCK:
+        # Forget clients of closed event loops whose users were never released;
+        # their connections can no longer be closed from another loop
+        for stale_key in [
+            k for k in _HTTP_CLIENTS if k[2] is not None and k[2].is_closed()
+        ]:
+            del _HTTP_CLIENTS[stale_key]
+            _HTTP_CLIENT_USERS.pop(stale_key, None)
+
+        http_client = _HTTP_CLIENTS.get(key)
+        if http_client is None or http_client.is_closed:
+            http_client_args = {
+                "limits": HTTP_CLIENT_LIMITS,
+                "timeout": HTTP_CLIENT_TIMEOUT,
+                "http2": HTTP2_ENABLED,
+            }
+            if async_client:
+                http_client = DefaultAsyncHttpxClient(**http_client_args)
+            else:
+                http_client = DefaultHttpxClient(**http_client_args)
+            _HTTP_CLIENTS[key] = http_client
+        if async_client:
+            _HTTP_CLIENT_USERS[key] = _HTTP_CLIENT_USERS.get(key, 0) + 1
+        return key, http_client
+
+
+async def _release_shared_http_client(key: _HttpClientKey) -> None:
+    """Drop one user of a shared async client, closing it after the last one."""
+    with _HTTP_CLIENTS_LOCK:
+        users = _HTTP_CLIENT_USERS.get(key, 0) - 1
+        if users > 0:
+            _HTTP_CLIENT_USERS[key] = users
+            return
+        _HTTP_CLIENT_USERS.pop(key, None)
+        http_client = _HTTP_CLIENTS.pop(key, None)
+    if http_client is not None:
+        await http_client.aclose()
+
+
+# Durations used by x-ratelimit-reset-* headers, e.g. "20ms", "1s", "6m0s"
+_RATE_LIMIT_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RATE_LIMIT_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _error_headers(error: Optional[BaseException]) -> Any:
+    """Return the response headers attached to an API error, if any."""
+    response = getattr(error, "response", None)
+    return getattr(response, "headers", None)
+
+
+def _retry_after_seconds(error: Optional[BaseException]) -> Optional[float]:
+    """Return the server-advised retry delay from an API error's headers, if any."""
+    headers = _error_headers(error)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        return None
+
+
+def _rate_limit_reset_seconds(error: Optional[BaseException]) -> Optional[float]:
+    """Return the longest x-ratelimit-reset-* window from an API error, if any."""
+    headers = _error_headers(error)
+    if not headers:
+        return None
+
+    reset_seconds = None
+    for header in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        value = headers.get(header)
+        if not value:
+            continue
+        matches = _RATE_LIMIT_DURATION_PATTERN.findall(value)
+        if not matches:
+            continue
+        seconds = sum(
+            float(amount) * _RATE_LIMIT_DURATION_UNITS[unit]
+            for amount, unit in matches
+        )
+        reset_seconds = max(reset_seconds or 0.0, seconds)
+    return reset_seconds
+
+
+def _finish_reason(choice: Any) -> Optional[str]:
+    """Read a choice's finish reason, supporting camelCase finishReason as well."""
+    finish_reason = getattr(choice, "finish_reason", None)
+    if finish_reason is None:
+        finish_reason = getattr(choice, "finishReason", None)
+    return finish_reason
+
+
+@atexit.register
+def _close_shared_http_clients() -> None:
+    """Close pooled sync clients on shutdown; async ones are released with their loop."""
+    with _HTTP_CLIENTS_LOCK:
+        for http_client in _HTTP_CLIENTS.values():
+            if isinstance(http_client, httpx.Client):
+                try:
+                    http_client.close()
+                except Exception:
+                    pass  # Ignore errors during cleanup
+        _HTTP_CLIENTS.clear()
+
+
+# Defaults for fields a stream may omit. Identifier-like literals are interned by
+# the compiler, so comparisons against them elsewhere hit the identity fast path.
+_ROLE_ASSISTANT = "assistant"
+_FINISH_STOP = "stop"
+_TOOL_TYPE_FUNCTION = "function"
+
+
+# Lightweight response objects assembled from a stream. They mirror the fields
+# of the OpenAI SDK types that downstream code reads.
+@dataclasses.dataclass(slots=True, frozen=True)
+class _StreamFunction:
+    name: str
+    arguments: str
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _StreamToolCall:
+    id: Optional[str]
+    type: str
+    function: _StreamFunction
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _StreamMessage:
+    role: str
+    content: str
+    tool_calls: Optional[List[_StreamToolCall]]
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _StreamChoice:
+    index: int
+    message: _StreamMessage
+    finish_reason: str
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _StreamResponse:
+    id: Optional[str]
+    created: Optional[int]
+    model: Optional[str]
+    choices: List[_StreamChoice]
+
 
 @dataclasses.dataclass
 class OpenAIClient(BaseClient):
+    def __post_init__(self):
+        super().__post_init__()
+
+        # Model-family flags, computed once instead of on every request attempt
+        self._is_gpt5: bool = "gpt-5" in self.model_name
+        self._is_deepseek_v31: bool = "deepseek-v3-1" in self.model_name
+        # GPT-5 uses 'max_completion_tokens'; GPT-4 and other models use 'max_tokens'
+        self._max_tokens_key: str = (
+            "max_completion_tokens" if self._is_gpt5 else "max_tokens"
+        )
+        # Async companion used for streaming when the main client is sync
+        self._async_stream_client: Optional[AsyncOpenAI] = None
+        # Retry loop stops once this many seconds have elapsed (llm.retry_budget_seconds)
+        self.retry_budget_seconds: float = self.cfg.llm.get(
+            "retry_budget_seconds", DEFAULT_RETRY_BUDGET_SECONDS
+        )
+        # Request parameters that do not change between calls
+        self._base_params: Dict[str, Any] = {
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+        }
+
     def _create_client(self) -> Union[AsyncOpenAI, OpenAI]:
-        """Create LLM client"""
-        http_client_args = {"headers": {"x-upstream-session-id": self.task_id}}
+        """Create LLM client backed by a shared, pooled HTTP client"""
+        # The session header is sent per request (see _create_message) so the
+        # underlying connection pool can be shared across tasks
+        key, http_client = _acquire_shared_http_client(
+            self.base_url, self.async_client
+        )
+        # Shared async HTTP clients this instance uses, released by aclose()
+        self._http_client_keys: List[_HttpClientKey] = []
         if self.async_client:
+            self._http_client_keys.append(key)
             return AsyncOpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url,
-                http_client=DefaultAsyncHttpxClient(**http_client_args),
+                http_client=http_client,
             )
         else:
             return OpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url,
-                http_client=DefaultHttpxClient(**http_client_args),
+                http_client=http_client,
             )
 
+    def _get_async_stream_client(self) -> AsyncOpenAI:
+        """
+        Return an async client for streaming requests.
+
+        Sync clients get a lazily created AsyncOpenAI companion on the shared
+        async HTTP pool, so streaming is always consumed with `async for`.
+        """
+        if self.async_client:
+            return self.client
+        if self._async_stream_client is None:
+            key, http_client = _acquire_shared_http_client(self.base_url, True)
+            self._http_client_keys.append(key)
+            self._async_stream_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=http_client,
+            )
+        return self._async_stream_client
+
+    async def aclose(self) -> None:
+        """
+        Release the shared async HTTP clients used by this instance.
+
+        Each is closed once its last user on the event loop is released. The
+        shared sync HTTP client stays open for later clients until interpreter exit.
+        """
+        keys, self._http_client_keys = self._http_client_keys, []
+        for key in keys:
+            await _release_shared_http_client(key)
+        self._async_stream_client = None
+
     def _update_token_usage(self, usage_data: Any) -> None:
         """Update cumulative token usage"""
         if usage_data:
@@ -64,6 +356,7 @@ class OpenAIClient(BaseClient):
             self.last_call_tokens = {
                 "prompt_tokens": input_tokens,
                 "completion_tokens": output_tokens,
+                "cached_tokens": cached_tokens,
             }
 
             # OpenAI does not provide cache_creation_input_tokens
@@ -71,11 +364,14 @@ class OpenAIClient(BaseClient):
             self.token_usage["total_output_tokens"] += output_tokens
             self.token_usage["total_cache_read_input_tokens"] += cached_tokens
 
+            cache_hit_rate = cached_tokens / input_tokens if input_tokens else 0.0
             self.task_log.log_step(
                 "info",
                 "LLM | Token Usage",
                 f"Input: {self.token_usage['total_input_tokens']}, "
-                f"Output: {self.token_usage['total_output_tokens']}",
+                f"Cache Read: {self.token_usage['total_cache_read_input_tokens']}, "
+                f"Output: {self.token_usage['total_output_tokens']}, "
+                f"Last Call Cache Hit Rate: {cache_hit_rate:.1%}",
             )
 
     async def _create_message(
@@ -93,8 +389,9 @@ class OpenAIClient(BaseClient):
         :return: OpenAI API response object or None (if error occurs).
         """
 
-        # Create a copy for sending to LLM (to avoid modifying the original)
-        messages_for_llm = [m.copy() for m in messages_history]
+        # Create a shallow list copy for sending to LLM. Message dicts are shared with
+        # messages_history; every change below replaces dicts rather than mutating them.
+        messages_for_llm = list(messages_history)
 
         # put the system prompt in the first message since OpenAI API does not support system prompt in
         if system_prompt:
@@ -124,43 +421,42 @@ class OpenAIClient(BaseClient):
 
         # Retry loop with dynamic max_tokens adjustment
         max_retries = 10
-        base_wait_time = 30
         current_max_tokens = self.max_tokens
+        # Wall-clock budget for the whole retry loop, including backoff sleeps
+        deadline = time.monotonic() + self.retry_budget_seconds
 
-        for attempt in range(max_retries):
-            params = {
-                "model": self.model_name,
-                "temperature": self.temperature,
-                "messages": messages_for_llm,
-                "stream": stream,
-                "top_p": self.top_p,
-                "extra_body": {},
-            }
-            # Check if the model is GPT-5, and adjust the parameter accordingly
-            if "gpt-5" in self.model_name:
-                # Use 'max_completion_tokens' for GPT-5
-                params["max_completion_tokens"] = current_max_tokens
-            else:
-                # Use 'max_tokens' for GPT-4 and other models
-                params["max_tokens"] = current_max_tokens
+        # Request parameters are invariant across retries except for max tokens
+        params = {
+            **self._base_params,
+            "messages": messages_for_llm,
+            "stream": stream,
+            "extra_headers": {"x-upstream-session-id": self.task_id},
+            "extra_body": {},
+        }
+
+        # Add repetition_penalty if it's not the default value
+        if self.repetition_penalty != 1.0:
+            params["extra_body"]["repetition_penalty"] = self.repetition_penalty
 
-            # Add repetition_penalty if it's not the default value
-            if self.repetition_penalty != 1.0:
-                params["extra_body"]["repetition_penalty"] = self.repetition_penalty
+        if self._is_deepseek_v31:
+            params["extra_body"]["thinking"] = {"type": "enabled"}
 
-            if "deepseek-v3-1" in self.model_name:
-                params["extra_body"]["thinking"] = {"type": "enabled"}
+        # auto-detect if we need to continue from the last assistant message
+        if messages_for_llm and messages_for_llm[-1].get("role") == "assistant":
+            params["extra_body"]["continue_final_message"] = True
+            params["extra_body"]["add_generation_prompt"] = False
 
-            # auto-detect if we need to continue from the last assistant message
-            if messages_for_llm and messages_for_llm[-1].get("role") == "assistant":
-                params["extra_body"]["continue_final_message"] = True
-                params["extra_body"]["add_generation_prompt"] = False
+        for attempt in range(max_retries):
+            params[self._max_tokens_key] = current_max_tokens
 
             try:
+                # Don't spend a round trip on a request the provider will rate-limit
+                await self._wait_for_rate_limit_cooldown(deadline)
+
                 # Handle streaming mode
                 if stream:
                     response = await self._handle_streaming_response(
-                        params, messages_history, attempt, max_retries
+                        params, messages_history, attempt, max_retries, deadline
                     )
                     if response:
                         return response, messages_history
@@ -175,25 +471,24 @@ class OpenAIClient(BaseClient):
                 # Update token count
                 self._update_token_usage(getattr(response, "usage", None))
                 
-                # Debug: log response structure
-                finish_reason = getattr(response.choices[0], 'finish_reason', 'N/A')
-                if finish_reason is None or finish_reason == 'N/A':
-                    self.task_log.log_step(
-                        "warning",
-                        "LLM | Response Debug",
-                        f"Response structure: {response}, Choices: {response.choices if response.choices else 'None'}",
-                    )
-                
+                choice = response.choices[0]
+                finish_reason = _finish_reason(choice)
+
                 self.task_log.log_step(
                     "info",
                     "LLM | Response Status",
-                    f"{finish_reason}",
+                    f"{finish_reason if finish_reason is not None else 'N/A'}",
                 )
 
-                # Check if response was truncated due to length limit
-                finish_reason = getattr(response.choices[0], "finish_reason", None)
                 # Handle None finish_reason - treat as 'stop' for compatibility
                 if finish_reason is None:
+                    # Debug: log response structure (only built when the field is missing;
+                    # the response repr already includes its choices)
+                    self.task_log.log_step(
+                        "warning",
+                        "LLM | Response Debug",
+                        f"Response structure: {response}",
+                    )
                     finish_reason = "stop"
                     self.task_log.log_step(
                         "warning",
@@ -202,7 +497,7 @@ class OpenAIClient(BaseClient):
                     )
                 if finish_reason == "length":
                     # If this is not the last retry, increase max_tokens and retry
-                    if attempt < max_retries - 1:
+                    if self._can_retry(attempt, max_retries, deadline):
                         # Increase max_tokens by 10%
                         current_max_tokens = int(current_max_tokens * 1.1)
                         self.task_log.log_step(
@@ -210,66 +505,66 @@ class OpenAIClient(BaseClient):
                             "LLM | Length Limit Reached",
                             f"Response was truncated due to length limit (attempt {attempt + 1}/{max_retries}). Increasing max_tokens to {current_max_tokens} and retrying...",
                         )
-                        await asyncio.sleep(base_wait_time)
+                        await self._backoff(
+                            attempt,
+                            base_delay=LENGTH_RETRY_BASE_DELAY_SECONDS,
+                            deadline=deadline,
+                        )
                         continue
                     else:
                         # Last retry, return the truncated response instead of raising exception
                         self.task_log.log_step(
                             "warning",
                             "LLM | Length Limit Reached - Returning Truncated Response",
-                            f"Response was truncated after {max_retries} attempts. Returning truncated response to allow ReAct loop to continue.",
+                            f"Response was truncated after {attempt + 1} attempts. Returning truncated response to allow ReAct loop to continue.",
                         )
                         # Return the truncated response and let the orchestrator handle it
                         return response, messages_history
 
                 # Check if the last 50 characters of the response appear more than 5 times in the response content.
                 # If so, treat it as a severe repeat and trigger a retry.
-                if hasattr(response.choices[0], "message") and hasattr(
-                    response.choices[0].message, "content"
-                ):
-                    resp_content = response.choices[0].message.content or ""
+                message = getattr(choice, "message", None)
+                if message is not None and hasattr(message, "content"):
+                    resp_content = message.content or ""
                 else:
-                    resp_content = getattr(response.choices[0], "text", "")
-
-                if resp_content and len(resp_content) >= 50:
-                    tail_50 = resp_content[-50:]
-                    repeat_count = resp_content.count(tail_50)
-                    if repeat_count > 5:
-                        # If this is not the last retry, retry
-                        if attempt < max_retries - 1:
-                            self.task_log.log_step(
-                                "warning",
-                                "LLM | Repeat Detected",
-                                f"Severe repeat: the last 50 chars appeared over 5 times (attempt {attempt + 1}/{max_retries}), retrying...",
-                            )
-                            await asyncio.sleep(base_wait_time)
-                            continue
-                        else:
-                            # Last retry, return anyway
-                            self.task_log.log_step(
-                                "warning",
-                                "LLM | Repeat Detected - Returning Anyway",
-                                f"Severe repeat detected after {max_retries} attempts. Returning response anyway.",
-                            )
+                    resp_content = getattr(choice, "text", "")
+
+                if resp_content and self._has_severe_repeat(resp_content):
+                    # If this is not the last retry, retry
+                    if self._can_retry(attempt, max_retries, deadline):
+                        self.task_log.log_step(
+                            "warning",
+                            "LLM | Repeat Detected",
+                            f"Severe repeat: the last 50 chars appeared over 5 times (attempt {attempt + 1}/{max_retries}), retrying...",
+                        )
+                        await self._backoff(attempt, deadline=deadline)
+                        continue
+                    else:
+                        # Last retry, return anyway
+                        self.task_log.log_step(
+                            "warning",
+                            "LLM | Repeat Detected - Returning Anyway",
+                            f"Severe repeat detected after {attempt + 1} attempts. Returning response anyway.",
+                        )
 
                 # Success - return the original messages_history (not the filtered copy)
                 # This ensures that the complete conversation history is preserved in logs
                 return response, messages_history
 
             except asyncio.TimeoutError as e:
-                if attempt < max_retries - 1:
+                if self._can_retry(attempt, max_retries, deadline):
                     self.task_log.log_step(
                         "warning",
                         "LLM | Timeout Error",
                         f"Timeout error (attempt {attempt + 1}/{max_retries}): {str(e)}, retrying...",
                     )
-                    await asyncio.sleep(base_wait_time)
+                    await self._backoff(attempt, e, deadline=deadline)
                     continue
                 else:
                     self.task_log.log_step(
                         "error",
                         "LLM | Timeout Error",
-                        f"Timeout error after {max_retries} attempts: {str(e)}",
+                        f"Timeout error after {attempt + 1} attempts: {str(e)}",
                     )
                     raise e
             except asyncio.CancelledError as e:
@@ -279,6 +574,68 @@ class OpenAIClient(BaseClient):
                     f"Request was cancelled: {str(e)}",
                 )
                 raise e
+            except RateLimitError as e:
+                # 429: wait for the window advised by the server, not a generic backoff
+                if self._can_retry(attempt, max_retries, deadline):
+                    delay = min(
+                        self._rate_limit_delay(attempt, e),
+                        max(0.0, deadline - time.monotonic()),
+                    )
+                    _RATE_LIMIT_COOLDOWN_UNTIL[self.base_url] = max(
+                        _RATE_LIMIT_COOLDOWN_UNTIL.get(self.base_url, 0.0),
+                        time.monotonic() + delay,
+                    )
+                    self.task_log.log_step(
+                        "warning",
+                        "LLM | Rate Limited",
+                        f"Rate limited (attempt {attempt + 1}/{max_retries}), retrying in {delay:.1f}s: {str(e)}",
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                else:
+                    self.task_log.log_step(
+                        "error",
+                        "LLM | Rate Limited",
+                        f"Rate limited after {attempt + 1} attempts: {str(e)}",
+                    )
+                    raise e
+            except (APIConnectionError, InternalServerError) as e:
+                # Connection failures, API timeouts and 5xx responses are transient
+                if self._can_retry(attempt, max_retries, deadline):
+                    self.task_log.log_step(
+                        "warning",
+                        "LLM | Transient API Error",
+                        f"{type(e).__name__} (attempt {attempt + 1}/{max_retries}): {str(e)}, retrying...",
+                    )
+                    await self._backoff(attempt, e, deadline=deadline)
+                    continue
+                else:
+                    self.task_log.log_step(
+                        "error",
+                        "LLM | Transient API Error",
+                        f"{type(e).__name__} after {attempt + 1} attempts: {str(e)}",
+                    )
+                    raise e
+            except (
+                AuthenticationError,
+                BadRequestError,
+                NotFoundError,
+                PermissionDeniedError,
+            ) as e:
+                # Rejected requests fail the same way on every attempt; don't retry them
+                if "longer than the model" in str(e):
+                    self.task_log.log_step(
+                        "error",
+                        "LLM | Context Length Error",
+                        f"Error: {str(e)}",
+                    )
+                else:
+                    self.task_log.log_step(
+                        "error",
+                        "LLM | Unrecoverable API Error",
+                        f"{type(e).__name__}: {str(e)}",
+                    )
+                raise e
             except Exception as e:
                 if "Error code: 400" in str(e) and "longer than the model" in str(e):
                     self.task_log.log_step(
@@ -288,25 +645,102 @@ class OpenAIClient(BaseClient):
                     )
                     raise e
                 else:
-                    if attempt < max_retries - 1:
+                    if self._can_retry(attempt, max_retries, deadline):
                         self.task_log.log_step(
                             "warning",
                             "LLM | API Error",
                             f"Error (attempt {attempt + 1}/{max_retries}): {str(e)}, retrying...",
                         )
-                        await asyncio.sleep(base_wait_time)
+                        await self._backoff(attempt, e, deadline=deadline)
                         continue
                     else:
                         self.task_log.log_step(
                             "error",
                             "LLM | API Error",
-                            f"Error after {max_retries} attempts: {str(e)}",
+                            f"Error after {attempt + 1} attempts: {str(e)}",
                         )
                         raise e
 
         # Should never reach here, but just in case
         raise Exception("Unexpected error: retry loop completed without returning")
 
+    @staticmethod
+    def _can_retry(attempt: int, max_retries: int, deadline: float) -> bool:
+        """Return True if another attempt fits in both the attempt count and time budget."""
+        return attempt < max_retries - 1 and time.monotonic() < deadline
+
+    async def _backoff(
+        self,
+        attempt: int,
+        error: Optional[BaseException] = None,
+        base_delay: float = RETRY_BASE_DELAY_SECONDS,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Sleep before the next retry using exponential backoff with jitter.
+
+        A Retry-After header on the error's response takes precedence over the
+        computed delay. The sleep never extends past the retry deadline.
+        """
+        delay = _retry_after_seconds(error)
+        if delay is None:
+            delay = min(RETRY_MAX_DELAY_SECONDS, base_delay * (2**attempt))
+            delay += random.uniform(0, 1.0)
+        if deadline is not None:
+            delay = min(delay, max(0.0, deadline - time.monotonic()))
+        await asyncio.sleep(delay)
+
+    def _rate_limit_delay(self, attempt: int, error: RateLimitError) -> float:
+        """
+        Delay before retrying a rate-limited request: Retry-After first, then the
+        x-ratelimit-reset-* windows, then exponential backoff with jitter.
+        """
+        delay = _retry_after_seconds(error)
+        if delay is None:
+            delay = _rate_limit_reset_seconds(error)
+        if delay is None:
+            delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (2**attempt))
+        # Small jitter so parallel agents do not retry in lockstep
+        return delay + random.uniform(0, 1.0)
+
+    async def _wait_for_rate_limit_cooldown(self, deadline: float) -> None:
+        """Sleep until the endpoint's rate-limit cooldown expires, but not past the deadline."""
+        wait = _RATE_LIMIT_COOLDOWN_UNTIL.get(self.base_url, 0.0) - time.monotonic()
+        wait = min(wait, deadline - time.monotonic())
+        if wait > 0:
+            self.task_log.log_step(
+                "info",
+                "LLM | Rate Limit Cooldown",
+                f"Endpoint recently rate limited, waiting {wait:.1f}s before sending",
+            )
+            await asyncio.sleep(wait)
+
+    @staticmethod
+    def _has_severe_repeat(content: str, tail_length: int = 50, max_repeats: int = 5) -> bool:
+        """
+        Check whether the last `tail_length` characters appear more than
+        `max_repeats` times in the content.
+
+        Occurrences are non-overlapping, matching str.count, but the scan stops
+        as soon as the threshold is exceeded instead of counting every
+        occurrence in long generations.
+        """
+        # Need room for max_repeats + 1 non-overlapping occurrences of the tail
+        if len(content) < tail_length * (max_repeats + 1):
+            return False
+
+        tail = content[-tail_length:]
+        hits = 0
+        start = 0
+        while True:
+            idx = content.find(tail, start)
+            if idx == -1:
+                return False
+            hits += 1
+            if hits > max_repeats:
+                return True
+            start = idx + tail_length
+
     def process_llm_response(
         self, llm_response: Any, message_history: List[Dict], agent_type: str = "main"
     ) -> tuple[str, bool, List[Dict]]:
@@ -320,18 +754,16 @@ class OpenAIClient(BaseClient):
 
         # Extract LLM response text
         # Handle both standard finish_reason and camelCase finishReason
-        finish_reason = getattr(llm_response.choices[0], "finish_reason", None)
-        if finish_reason is None:
-            finish_reason = getattr(llm_response.choices[0], "finishReason", None)
-        if finish_reason is None:
-            finish_reason = "stop"  # Default to stop if not found
+        choice = llm_response.choices[0]
+        message = choice.message
+        finish_reason = _finish_reason(choice) or "stop"  # Default to stop if not found
             
         if finish_reason == "stop":
-            assistant_response_text = llm_response.choices[0].message.content or ""
+            assistant_response_text = message.content or ""
             
             # Handle reasoning field (for o1-style models and MiroThinker)
             # If reasoning_content exists, prepend it as <think> tags
-            reasoning_content = getattr(llm_response.choices[0].message, "reasoning_content", None)
+            reasoning_content = getattr(message, "reasoning_content", None)
             if reasoning_content:
                 assistant_response_text = f"<think>\n{reasoning_content}\n</think>\n\n{assistant_response_text}"
 
@@ -340,7 +772,7 @@ class OpenAIClient(BaseClient):
             )
 
         elif finish_reason == "length":
-            assistant_response_text = llm_response.choices[0].message.content or ""
+            assistant_response_text = message.content or ""
             if assistant_response_text == "":
                 assistant_response_text = "LLM response is empty."
             elif "Context length exceeded" in assistant_response_text:
@@ -375,8 +807,6 @@ class OpenAIClient(BaseClient):
         self, llm_response: Any, assistant_response_text: str
     ) -> List[Dict]:
         """Extract tool call information from LLM response"""
-        from ...utils.parsing_utils import parse_llm_response_for_tool_calls
-
         # First, try to get tool_calls from the response object (OpenAI format)
         if llm_response and llm_response.choices:
             message = llm_response.choices[0].message
@@ -408,13 +838,13 @@ class OpenAIClient(BaseClient):
     ) -> List[Dict]:
         """Update message history with tool calls data (llm client specific)"""
 
-        merged_text = "\n".join(
-            [
-                item[1]["text"]
-                for item in all_tool_results_content_with_id
-                if item[1]["type"] == "text"
-            ]
-        )
+        # Collect text parts once; unpacking avoids re-indexing each tuple
+        text_parts = [
+            result["text"]
+            for _, result in all_tool_results_content_with_id
+            if result["type"] == "text"
+        ]
+        merged_text = "\n".join(text_parts)
 
         message_history.append(
             {
@@ -425,21 +855,15 @@ class OpenAIClient(BaseClient):
 
         return message_history
 
-    def generate_agent_system_prompt(self, date: Any, mcp_servers: List[Dict]) -> str:
-        return generate_mcp_system_prompt(date, mcp_servers)
+    def generate_agent_system_prompt(
+        self, date: Any, mcp_servers: List[Dict], lazy: bool = False
+    ) -> str:
+        return generate_mcp_system_prompt(date, mcp_servers, lazy=lazy)
 
     def _estimate_tokens(self, text: str) -> int:
         """Use tiktoken to estimate the number of tokens in text"""
-        if not hasattr(self, "encoding"):
-            # Initialize tiktoken encoder
-            try:
-                self.encoding = tiktoken.get_encoding("o200k_base")
-            except Exception:
-                # If o200k_base is not available, use cl100k_base as fallback
-                self.encoding = tiktoken.get_encoding("cl100k_base")
-
         try:
-            return len(self.encoding.encode(text))
+            return self._count_tokens_cached(text)
         except Exception as e:
             # If encoding fails, use simple estimation: approximately 1 token per 4 characters
             self.task_log.log_step(
@@ -463,13 +887,13 @@ class OpenAIClient(BaseClient):
         buffer_factor = 1.5
 
         # Calculate token count for summary prompt
-        summary_tokens = int(self._estimate_tokens(summary_prompt) * buffer_factor)
+        summary_tokens = int(self._estimate_summary_prompt_tokens(summary_prompt) * buffer_factor)
 
         # Calculate token count for the last user message in message_history
         last_user_tokens = 0
         if message_history[-1]["role"] == "user":
             content = message_history[-1]["content"]
-            last_user_tokens = int(self._estimate_tokens(str(content)) * buffer_factor)
+            last_user_tokens = int(self._estimate_tokens(self._content_text(content)) * buffer_factor)
 
         # Calculate total token count: last prompt + completion + last user message + summary + reserved response space
         estimated_total = (
@@ -517,12 +941,15 @@ class OpenAIClient(BaseClient):
 
         total_input = token_usage.get("total_input_tokens", 0)
         total_output = token_usage.get("total_output_tokens", 0)
-        cache_input = token_usage.get("total_cache_input_tokens", 0)
+        total_cache_read = token_usage.get("total_cache_read_input_tokens", 0)
+        cache_hit_rate = total_cache_read / total_input if total_input else 0.0
 
         summary_lines = []
         summary_lines.append("\n" + "-" * 20 + " Token Usage " + "-" * 20)
         summary_lines.append(f"Total Input Tokens: {total_input}")
-        summary_lines.append(f"Total Cache Input Tokens: {cache_input}")
+        summary_lines.append(
+            f"Total Cache Read Input Tokens: {total_cache_read} ({cache_hit_rate:.1%} of input)"
+        )
         summary_lines.append(f"Total Output Tokens: {total_output}")
         summary_lines.append("-" * (40 + len(" Token Usage ")))
         summary_lines.append("Pricing is disabled - no cost information available")
@@ -531,7 +958,7 @@ class OpenAIClient(BaseClient):
         # Generate log string
         log_string = (
             f"[{self.model_name}] Total Input: {total_input}, "
-            f"Cache Input: {cache_input}, "
+            f"Cache Read: {total_cache_read}, "
             f"Output: {total_output}"
         )
 
@@ -546,6 +973,7 @@ class OpenAIClient(BaseClient):
         messages_history: List[Dict[str, Any]],
         attempt: int,
         max_retries: int,
+        deadline: float,
     ):
         """
         Handle streaming response from OpenAI API.
@@ -555,19 +983,24 @@ class OpenAIClient(BaseClient):
             messages_history: Message history
             attempt: Current retry attempt
             max_retries: Maximum retry attempts
+            deadline: time.monotonic() value after which no retry is started
             
         Returns:
             Constructed response object or None if needs retry
         """
         try:
-            # Create streaming request
-            if self.async_client:
-                stream = await self.client.chat.completions.create(**params)
-            else:
-                stream = self.client.chat.completions.create(**params)
+            # Create streaming request. Streaming always goes through the async client
+            # so reading the stream never blocks the event loop.
+            stream = await self._get_async_stream_client().chat.completions.create(
+                **params
+            )
             
-            # Accumulate response
-            full_content = ""
+            # Accumulate response chunks in a list and join once at the end
+            content_parts: List[str] = []
+            content_length = 0
+            # Trailing characters of streamed content, used to detect a tool call
+            # marker that is split across chunk boundaries
+            stream_tail = ""
             finish_reason = None
             response_id = None
             created = None
@@ -575,118 +1008,130 @@ class OpenAIClient(BaseClient):
             role = None
             
             # Generate message ID for streaming
-            message_id = str(uuid.uuid4())
+            message_id = uuid.uuid4().hex
             
-            # For collecting tool calls in streaming mode
-            tool_calls_dict = {}  # indexed by tool_call index
+            # For collecting tool calls in streaming mode, indexed by tool_call index
+            tool_calls_raw: List[Optional[Dict[str, Any]]] = []
             
             # Flag to track if we've encountered tool call marker
             tool_call_encountered = False
             
+            # Bind the handler and list append once instead of looking them up per chunk
+            stream_handler = self.stream_handler
+            append_content = content_parts.append
+
             # Process streaming chunks
             chunk_count = 0
-            if self.async_client:
-                async for chunk in stream:
-                    chunk_count += 1
-                    # Debug log removed to reduce log noise
-                    # self.task_log.log_step(
-                    #     "info",
-                    #     "LLM | Stream Debug",
-                    #     f"Received chunk #{chunk_count}"
-                    # )
-                    response_id = chunk.id
-                    created = chunk.created
-                    model = chunk.model
+            last_chunk = None
+            async for chunk in stream:
+                chunk_count += 1
+                last_chunk = chunk
+                # Debug log removed to reduce log noise
+                # self.task_log.log_step(
+                #     "info",
+                #     "LLM | Stream Debug",
+                #     f"Received chunk #{chunk_count}"
+                # )
+                response_id = chunk.id
+                created = chunk.created
+                model = chunk.model
+                
+                choices = chunk.choices
+                if choices:
+                    choice = choices[0]
+                    finish_reason = choice.finish_reason
                     
-                    if chunk.choices and len(chunk.choices) > 0:
-                        choice = chunk.choices[0]
-                        finish_reason = choice.finish_reason
-                        
-                        # Handle content delta (support both 'content' and 'reasoning' fields)
-                        content_delta = None
-                        if choice.delta:
-                            # Standard OpenAI format uses 'content'
-                            if hasattr(choice.delta, 'content') and choice.delta.content:
-                                content_delta = choice.delta.content
-                            # Some models (like doubao) use 'reasoning' field
-                            elif hasattr(choice.delta, 'reasoning') and choice.delta.reasoning:
-                                content_delta = choice.delta.reasoning
-                        
-                        if content_delta:
-                            full_content += content_delta
-                            
-                            # Send to stream_handler if available
-                            # BUT: Stop sending when <use_mcp_tool> tag is encountered
-                            if self.stream_handler and not tool_call_encountered:
-                                # Check if we've hit the tool call marker
-                                if "<use_mcp_tool>" in full_content:
-                                    # Mark that we've encountered tool call
-                                    tool_call_encountered = True
-                                    
-                                    # Extract only the content before <use_mcp_tool>
-                                    tool_start_idx = full_content.index("<use_mcp_tool>")
-                                    # Calculate how much we've already sent
-                                    already_sent_length = len(full_content) - len(content_delta)
-                                    
-                                    if tool_start_idx > already_sent_length:
-                                        # Send only the part before <use_mcp_tool>
-                                        remaining_content = full_content[already_sent_length:tool_start_idx]
-                                        if remaining_content:
-                                            await self.stream_handler.message(
-                                                message_id=message_id,
-                                                delta_content=remaining_content
-                                            )
-                                    # Don't send anything more after this
-                                else:
-                                    # No tool call yet, send normally
-                                    await self.stream_handler.message(
-                                        message_id=message_id,
-                                        delta_content=content_delta
-                                    )
-                        
-                        # Handle role
-                        if choice.delta and choice.delta.role:
-                            role = choice.delta.role
+                    # Read each delta field once (a missing field reads as None)
+                    delta = choice.delta
+                    delta_content = getattr(delta, 'content', None)
+                    delta_reasoning = getattr(delta, 'reasoning', None)
+                    delta_role = getattr(delta, 'role', None)
+                    delta_tool_calls = getattr(delta, 'tool_calls', None)
+
+                    # Handle content delta (support both 'content' and 'reasoning' fields)
+                    # Standard OpenAI format uses 'content'; some models (like doubao) use 'reasoning'
+                    content_delta = delta_content or delta_reasoning
+                    
+                    if content_delta:
+                        append_content(content_delta)
+                        # Calculate how much we've already sent
+                        already_sent_length = content_length
+                        content_length += len(content_delta)
                         
-                        # Handle tool calls in streaming mode
-                        if choice.delta and hasattr(choice.delta, 'tool_calls') and choice.delta.tool_calls:
-                            for tool_call_delta in choice.delta.tool_calls:
-                                idx = tool_call_delta.index
-                                if idx not in tool_calls_dict:
-                                    tool_calls_dict[idx] = {
-                                        "id": tool_call_delta.id if hasattr(tool_call_delta, 'id') else None,
-                                        "type": tool_call_delta.type if hasattr(tool_call_delta, 'type') else "function",
-                                        "function": {
-                                            "name": "",
-                                            "arguments": ""
-                                        }
-                                    }
+                        # Send to stream_handler if available
+                        # BUT: Stop sending when <use_mcp_tool> tag is encountered
+                        if stream_handler and not tool_call_encountered:
+                            # Check if we've hit the tool call marker (it may start in the tail)
+                            window_start = already_sent_length - len(stream_tail)
+                            window = stream_tail + content_delta
+                            tag_idx = window.find("<use_mcp_tool>")
+                            stream_tail = window[-(len("<use_mcp_tool>") - 1):]
+                            if tag_idx != -1:
+                                # Mark that we've encountered tool call
+                                tool_call_encountered = True
                                 
-                                # Accumulate function name
-                                if hasattr(tool_call_delta, 'function') and tool_call_delta.function:
-                                    if hasattr(tool_call_delta.function, 'name') and tool_call_delta.function.name:
-                                        tool_calls_dict[idx]["function"]["name"] += tool_call_delta.function.name
-                                    if hasattr(tool_call_delta.function, 'arguments') and tool_call_delta.function.arguments:
-                                        tool_calls_dict[idx]["function"]["arguments"] += tool_call_delta.function.arguments
+                                # Extract only the content before <use_mcp_tool>
+                                tool_start_idx = window_start + tag_idx
+                                
+                                if tool_start_idx > already_sent_length:
+                                    # Send only the part before <use_mcp_tool>
+                                    remaining_content = content_delta[: tool_start_idx - already_sent_length]
+                                    if remaining_content:
+                                        await stream_handler.message(
+                                            message_id=message_id,
+                                            delta_content=remaining_content
+                                        )
+                                # Don't send anything more after this
+                            else:
+                                # No tool call yet, send normally
+                                await stream_handler.message(
+                                    message_id=message_id,
+                                    delta_content=content_delta
+                                )
                     
-                    # Handle usage (usually in the last chunk)
-                    if hasattr(chunk, 'usage') and chunk.usage:
-                        self._update_token_usage(chunk.usage)
-            else:
-                # Sync client (not recommended for streaming)
-                for chunk in stream:
-                    if chunk.choices and len(chunk.choices) > 0:
-                        choice = chunk.choices[0]
-                        if choice.delta and choice.delta.content:
-                            content_delta = choice.delta.content
-                            full_content += content_delta
+                    # Handle role
+                    if delta_role:
+                        role = delta_role
                     
-                    if hasattr(chunk, 'usage') and chunk.usage:
-                        self._update_token_usage(chunk.usage)
-            
+                    # Handle tool calls in streaming mode
+                    if delta_tool_calls:
+                        for tool_call_delta in delta_tool_calls:
+                            idx = tool_call_delta.index
+                            if idx >= len(tool_calls_raw):
+                                tool_calls_raw.extend([None] * (idx + 1 - len(tool_calls_raw)))
+                            tool_call = tool_calls_raw[idx]
+                            if tool_call is None:
+                                tool_call = tool_calls_raw[idx] = {
+                                    "id": getattr(tool_call_delta, 'id', None),
+                                    "type": getattr(tool_call_delta, 'type', _TOOL_TYPE_FUNCTION),
+                                    "function": {
+                                        # Name and argument fragments, joined once the stream ends
+                                        "name": [],
+                                        "arguments": []
+                                    }
+                                }
+                            
+                            # Accumulate function name and arguments
+                            function_delta = getattr(tool_call_delta, 'function', None)
+                            if function_delta:
+                                name_delta = getattr(function_delta, 'name', None)
+                                if name_delta:
+                                    tool_call["function"]["name"].append(name_delta)
+                                arguments_delta = getattr(function_delta, 'arguments', None)
+                                if arguments_delta:
+                                    tool_call["function"]["arguments"].append(arguments_delta)
+
+
+            # Usage is only reported on the terminal frame
+            usage = getattr(last_chunk, 'usage', None)
+            if usage:
+                self._update_token_usage(usage)
+
+            full_content = "".join(content_parts)
+
             # Check if truncated due to length
             if finish_reason == "length":
-                if attempt < max_retries - 1:
+                if self._can_retry(attempt, max_retries, deadline):
                     self.task_log.log_step(
                         "warning",
                         "LLM | Length Limit Reached",
@@ -701,37 +1146,34 @@ class OpenAIClient(BaseClient):
                     )
             
             # Construct complete response object (for compatibility)
-            from types import SimpleNamespace
-            
-            # Convert tool_calls_dict to list (if any)
-            tool_calls_list = None
-            if tool_calls_dict:
-                tool_calls_list = []
-                for idx in sorted(tool_calls_dict.keys()):
-                    tc = tool_calls_dict[idx]
-                    tool_call_obj = SimpleNamespace(
-                        id=tc["id"],
-                        type=tc["type"],
-                        function=SimpleNamespace(
-                            name=tc["function"]["name"],
-                            arguments=tc["function"]["arguments"]
-                        )
+            # Convert collected tool calls to a list (None if there were none)
+            tool_calls_list = [
+                _StreamToolCall(
+                    id=tc["id"],
+                    type=tc["type"],
+                    function=_StreamFunction(
+                        name="".join(tc["function"]["name"]),
+                        arguments="".join(tc["function"]["arguments"])
                     )
-                    tool_calls_list.append(tool_call_obj)
+                )
+                for tc in tool_calls_raw
+                if tc is not None
+            ] or None
             
-            message = SimpleNamespace(
-                role=role or "assistant",
+            message = _StreamMessage(
+                role=sys.intern(role) if role else _ROLE_ASSISTANT,
                 content=full_content,
                 tool_calls=tool_calls_list,
             )
             
-            choice = SimpleNamespace(
+            choice = _StreamChoice(
                 index=0,
                 message=message,
-                finish_reason=finish_reason or "stop",
+                # Decoded from JSON, so intern it to match the literals it is compared to
+                finish_reason=sys.intern(finish_reason) if finish_reason else _FINISH_STOP,
             )
             
-            response = SimpleNamespace(
+            response = _StreamResponse(
                 id=response_id,
                 created=created,
                 model=model or self.model_name,
@@ -746,4 +1188,5 @@ class OpenAIClient(BaseClient):
                 "LLM | Streaming Error",
                 f"Error during streaming: {str(e)}",
             )
-            return None  # Trigger retry
+            # Let the retry loop classify the error and back off before retrying
+            raise
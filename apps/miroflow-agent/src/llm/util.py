@@ -6,6 +6,7 @@ Utility decorators and helpers for LLM client operations.
 
 This module provides:
 - Timeout decorator for async LLM API calls
+- Shared tiktoken encoder loading for token estimation
 - Other common utilities shared across LLM providers
 """
 
@@ -13,6 +14,8 @@ import asyncio
 import functools
 from typing import Awaitable, Callable, TypeVar
 
+import tiktoken
+
 T = TypeVar("T")
 
 
@@ -34,3 +37,18 @@ def with_timeout(
         return wrapper
 
     return decorator
+
+
+@functools.lru_cache(maxsize=4)
+def get_encoding(name: str = "o200k_base") -> tiktoken.Encoding:
+    """
+    Load a tiktoken encoding once per process and share it across clients.
+
+    Loading an encoding reads its BPE merge table, which is slow, so the result
+    is cached by name. Falls back to cl100k_base if the requested encoding is
+    not available.
+    """
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
@@ -7,9 +7,15 @@ from .parsing_utils import (
     extract_failure_experience_summary,
     extract_llm_response_text,
     parse_llm_response_for_tool_calls,
+    parse_mcp_tool_block,
     safe_json_loads,
 )
 from .prompt_utils import (
+    FAILURE_EXPERIENCE_FOOTER,
+    FAILURE_EXPERIENCE_HEADER,
+    FAILURE_EXPERIENCE_ITEM,
+    FAILURE_SUMMARY_ASSISTANT_PREFIX,
+    FAILURE_SUMMARY_PROMPT,
     generate_agent_specific_system_prompt,
     generate_agent_summarize_prompt,
     generate_mcp_system_prompt,
@@ -19,6 +25,7 @@ from .wrapper_utils import ErrorBox, ResponseBox
 __all__ = [
     # parsing_utils
     "parse_llm_response_for_tool_calls",
+    "parse_mcp_tool_block",
     "extract_llm_response_text",
     "extract_failure_experience_summary",
     "safe_json_loads",
@@ -26,6 +33,11 @@ __all__ = [
     "generate_mcp_system_prompt",
     "generate_agent_specific_system_prompt",
     "generate_agent_summarize_prompt",
+    "FAILURE_EXPERIENCE_HEADER",
+    "FAILURE_EXPERIENCE_ITEM",
+    "FAILURE_EXPERIENCE_FOOTER",
+    "FAILURE_SUMMARY_PROMPT",
+    "FAILURE_SUMMARY_ASSISTANT_PREFIX",
     # wrapper_utils
     "ErrorBox",
     "ResponseBox",
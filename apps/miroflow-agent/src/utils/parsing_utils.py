@@ -14,12 +14,23 @@ This module provides functions for:
 import json
 import logging
 import re
-from typing import Any, Dict, List, Union
+import sys
+from typing import Any, Dict, List, Tuple, Union
 
 from json_repair import repair_json
 
 logger = logging.getLogger("miroflow_agent")
 
+# MCP-format tool calls, matched in a single pass over the response text
+_MCP_TOOL_RE = re.compile(
+    r"<use_mcp_tool>\s*<server_name>(?P<server_name>.*?)</server_name>"
+    r"\s*<tool_name>(?P<tool_name>.*?)</tool_name>"
+    r"\s*<arguments>\s*(?P<arguments>[\s\S]*?)\s*</arguments>\s*</use_mcp_tool>",
+    re.DOTALL,
+)
+_MCP_TOOL_START_RE = re.compile(r"<use_mcp_tool>")
+_THINK_RE = re.compile(r"<think>([\s\S]*?)</think>")
+
 
 def filter_none_values(arguments: Union[Dict, Any]) -> Union[Dict, Any]:
     """
@@ -151,7 +162,7 @@ def extract_failure_experience_summary(text: str) -> str:
     content = ""
 
     # Extract think content
-    think_match = re.search(r"<think>([\s\S]*?)</think>", text)
+    think_match = _THINK_RE.search(text)
     if think_match:
         think_content = think_match.group(1).strip()
         # Get content after </think>
@@ -161,7 +172,7 @@ def extract_failure_experience_summary(text: str) -> str:
         after_think = text
 
     # Remove <use_mcp_tool>...</use_mcp_tool> block from content
-    mcp_match = re.search(r"<use_mcp_tool>[\s\S]*", after_think)
+    mcp_match = _MCP_TOOL_START_RE.search(after_think)
     if mcp_match:
         content = after_think[: mcp_match.start()].strip()
     else:
@@ -197,8 +208,7 @@ def extract_llm_response_text(llm_response: Union[str, Dict]) -> str:
         content = str(llm_response)
 
     # Find the position of <use_mcp_tool> tag
-    tool_start_pattern = r"<use_mcp_tool>"
-    match = re.search(tool_start_pattern, content)
+    match = _MCP_TOOL_START_RE.search(content)
 
     if match:
         # If <use_mcp_tool> tag is found, only return content before the tag
@@ -208,6 +218,48 @@ def extract_llm_response_text(llm_response: Union[str, Dict]) -> str:
         return content.strip()
 
 
+def _split_function_name(name: str) -> Tuple[str, str]:
+    """
+    Split a function-calling tool name of the form '<server>-<tool>'.
+
+    The parts are interned: they are compared against the interned server and
+    tool names from the ToolManager on every dispatch.
+    """
+    if "-" in name:
+        server_name, tool_name = name.rsplit("-", maxsplit=1)
+    else:
+        server_name = "unknown"
+        tool_name = name
+    return sys.intern(server_name), sys.intern(tool_name)
+
+
+def _mcp_tool_call_from_match(match: "re.Match[str]") -> Dict[str, Any]:
+    arguments = safe_json_loads(match.group("arguments").strip())
+    return {
+        "server_name": sys.intern(match.group("server_name").strip()),
+        "tool_name": sys.intern(match.group("tool_name").strip()),
+        "arguments": filter_none_values(arguments),
+        "id": None,
+    }
+
+
+def parse_mcp_tool_block(text: str) -> Union[Dict[str, Any], None]:
+    """
+    Parse the first <use_mcp_tool> block in text.
+
+    Args:
+        text: LLM response text
+
+    Returns:
+        Tool call dict with keys: server_name, tool_name, arguments, id,
+        or None if the text contains no complete tool block
+    """
+    match = _MCP_TOOL_RE.search(text)
+    if match is None:
+        return None
+    return _mcp_tool_call_from_match(match)
+
+
 def parse_llm_response_for_tool_calls(
     llm_response_content_text: Union[str, Dict, List],
 ) -> List[Dict[str, Any]]:
@@ -232,11 +284,7 @@ def parse_llm_response_for_tool_calls(
         for item in llm_response_content_text.get("output") or []:
             if item.get("type") == "function_call":
                 name = item.get("name", "")
-                if "-" in name:
-                    server_name, tool_name = name.rsplit("-", maxsplit=1)
-                else:
-                    server_name = "unknown"
-                    tool_name = name
+                server_name, tool_name = _split_function_name(name)
                 arguments_str = item.get("arguments")
                 arguments = safe_json_loads(arguments_str)
                 arguments = filter_none_values(arguments)
@@ -255,11 +303,7 @@ def parse_llm_response_for_tool_calls(
         tool_calls = []
         for tool_call in llm_response_content_text:
             name = tool_call.function.name
-            if "-" in name:
-                server_name, tool_name = name.rsplit("-", maxsplit=1)
-            else:
-                server_name = "unknown"
-                tool_name = name
+            server_name, tool_name = _split_function_name(name)
             arguments_str = tool_call.function.arguments
 
             # Parse JSON string to dictionary
@@ -304,30 +348,7 @@ def parse_llm_response_for_tool_calls(
         return tool_calls
 
     # for other clients, such as qwen and anthropic, we use MCP instead of tool calls
-    tool_calls = []
-    # Find all <use_mcp_tool> tags
-    tool_call_patterns = re.findall(
-        r"<use_mcp_tool>\s*<server_name>(.*?)</server_name>\s*<tool_name>(.*?)</tool_name>\s*<arguments>\s*([\s\S]*?)\s*</arguments>\s*</use_mcp_tool>",
-        llm_response_content_text,
-        re.DOTALL,
-    )
-
-    for match in tool_call_patterns:
-        server_name = match[0].strip()
-        tool_name = match[1].strip()
-        arguments_str = match[2].strip()
-
-        # Parse JSON string to dictionary
-        arguments = safe_json_loads(arguments_str)
-        arguments = filter_none_values(arguments)
-
-        tool_calls.append(
-            {
-                "server_name": server_name,
-                "tool_name": tool_name,
-                "arguments": arguments,
-                "id": None,
-            }
-        )
-
-    return tool_calls
+    return [
+        _mcp_tool_call_from_match(match)
+        for match in _MCP_TOOL_RE.finditer(llm_response_content_text)
+    ]
@@ -11,6 +11,12 @@ This module provides:
 - Failure experience templates for retry mechanisms
 """
 
+import copy
+import functools
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+
 # ============================================================================
 # Failure Experience Templates
 # ============================================================================
@@ -35,6 +41,29 @@ FAILURE_EXPERIENCE_FOOTER = """=== End of Analysis ===
 Based on the above, you should try a different strategy this time.
 """
 
+
+def format_failure_item(attempt_number, failure_summary):
+    """Render FAILURE_EXPERIENCE_ITEM directly, without the generic str.format parser."""
+    return f"[Attempt {attempt_number}]\n{failure_summary}\n\n"
+
+
+def format_failure_experiences(failure_summaries):
+    """
+    Render the full failure-experience section (header, one item per
+    attempt numbered from 1, footer) to append to a task description.
+    """
+    return "".join(
+        (
+            FAILURE_EXPERIENCE_HEADER,
+            *(
+                format_failure_item(attempt_number, failure_summary)
+                for attempt_number, failure_summary in enumerate(failure_summaries, 1)
+            ),
+            FAILURE_EXPERIENCE_FOOTER,
+        )
+    )
+
+
 FAILURE_SUMMARY_PROMPT = """The task was not completed successfully. Do NOT call any tools. Provide a summary:
 
 Failure type: [incomplete / blocked / misdirected]
@@ -51,6 +80,7 @@ FAILURE_SUMMARY_THINK_CONTENT = """We need to write a structured post-mortem sty
 * **What happened**: describe the approach taken and why it didn't reach a final answer
 * **Useful findings**: list any facts, intermediate results, or conclusions that can be reused"""
 
+# Built once at import; callers must use this constant rather than re-formatting it
 FAILURE_SUMMARY_ASSISTANT_PREFIX = (
     f"<think>\n{FAILURE_SUMMARY_THINK_CONTENT}\n</think>\n\n"
 )
@@ -74,28 +104,78 @@ refusal_keywords = [
     "I'm sorry, I cannot solve",
 ]
 
+# Models mix ASCII and typographic apostrophes, so refusal keywords match either
+_APOSTROPHE_CLASS = "['\u2018\u2019]"
+_APOSTROPHE_TO_ASCII = str.maketrans("\u2018\u2019", "''")
 
-def generate_mcp_system_prompt(date, mcp_servers):
-    """
-    Generate the MCP (Model Context Protocol) system prompt for LLM.
+# Single-pass matchers for the lists above
+_MCP_TAG_PATTERN = re.compile("|".join(map(re.escape, mcp_tags)))
+_REFUSAL_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword.translate(_APOSTROPHE_TO_ASCII)).replace(
+            "'", _APOSTROPHE_CLASS
+        )
+        for keyword in refusal_keywords
+    )
+)
 
-    Creates a structured prompt that instructs the LLM on how to use available
-    MCP tools. Includes tool definitions, XML formatting instructions, and
-    general task-solving guidelines.
 
-    Args:
-        date: Current date object for timestamp inclusion
-        mcp_servers: List of server definitions, each containing 'name' and 'tools'
+def contains_mcp_tags(text):
+    """Return True if the text contains any MCP tool-call tag."""
+    return _MCP_TAG_PATTERN.search(text) is not None
 
-    Returns:
-        Complete system prompt string with tool definitions and usage instructions
-    """
-    formatted_date = date.strftime("%Y-%m-%d")
 
-    # Start building the template, now follows https://docs.anthropic.com/en/docs/build-with-claude/tool-use/overview#tool-use-system-prompt
-    template = f"""In this environment you have access to a set of tools you can use to answer the user's question. 
+def find_mcp_tags(text):
+    """Return the MCP tags found in the text, in declaration order."""
+    found = set(_MCP_TAG_PATTERN.findall(text))
+    return [tag for tag in mcp_tags if tag in found]
+
+
+def is_refusal(text):
+    """Return True if the text contains any refusal keyword."""
+    return _REFUSAL_PATTERN.search(text) is not None
+
+
+def find_refusal_keywords(text):
+    """Return the refusal keywords found in the text, in declaration order."""
+    found = {
+        match.translate(_APOSTROPHE_TO_ASCII)
+        for match in _REFUSAL_PATTERN.findall(text)
+    }
+    return [
+        keyword
+        for keyword in refusal_keywords
+        if keyword.translate(_APOSTROPHE_TO_ASCII) in found
+    ]
+
+
+# ============================================================================
+# System Prompt Fragments
+# ============================================================================
 
-You only have access to the tools provided below. You can only use one tool per message, and will receive the result of that tool in the user's next response. You use tools step-by-step to accomplish a given task, with each tool-use informed by the result of the previous tool-use. Today is: {formatted_date}
+# Static parts of the system prompts; only the date and the tool section vary.
+# The layout follows https://docs.anthropic.com/en/docs/build-with-claude/tool-use/overview#tool-use-system-prompt
+_PROMPT_INTRO = "In this environment you have access to a set of tools you can use to answer the user's question. "
+
+_MCP_PROMPT_HEAD = (
+    _PROMPT_INTRO
+    + """
+
+You only have access to the tools provided below. You can only use one tool per message, and will receive the result of that tool in the user's next response. You use tools step-by-step to accomplish a given task, with each tool-use informed by the result of the previous tool-use. Today is: """
+)
+
+_NO_MCP_PROMPT_HEAD = _PROMPT_INTRO + " Today is: "
+
+# Shared by both prompts
+_IMPORTANT_NOTES = """Important Notes:
+- Tool-use must be placed **at the end** of your response, **top-level**, and not nested within other tags.
+- Always adhere to this format for the tool use to ensure proper parsing and execution.
+
+String and scalar parameters should be specified as is, while lists and objects should use JSON format. Note that spaces for string values are not stripped. The output is not expected to be valid XML and is parsed with regular expressions.
+"""
+
+_MCP_PROMPT_BODY = (
+    """
 
 # Tool-Use Formatting Instructions 
 
@@ -116,100 +196,255 @@ Usage:
 <server_name>server name here</server_name>
 <tool_name>tool name here</tool_name>
 <arguments>
-{{
+{
 "param1": "value1",
 "param2": "value2 \\"escaped string\\""
-}}
+}
 </arguments>
 </use_mcp_tool>
 
-Important Notes:
-- Tool-use must be placed **at the end** of your response, **top-level**, and not nested within other tags.
-- Always adhere to this format for the tool use to ensure proper parsing and execution.
-
-String and scalar parameters should be specified as is, while lists and objects should use JSON format. Note that spaces for string values are not stripped. The output is not expected to be valid XML and is parsed with regular expressions.
-Here are the functions available in JSONSchema format:
+"""
+    + _IMPORTANT_NOTES
+    + """Here are the functions available in JSONSchema format:
 
 """
+)
+
+_NO_MCP_PROMPT_BODY = "\n\n" + _IMPORTANT_NOTES
 
-    # Add MCP servers section
-    if mcp_servers and len(mcp_servers) > 0:
-        for server in mcp_servers:
-            template += f"\n## Server name: {server['name']}\n"
-
-            if "tools" in server and len(server["tools"]) > 0:
-                for tool in server["tools"]:
-                    # Skip tools that failed to load (they only have 'error' key)
-                    if "error" in tool and "name" not in tool:
-                        continue
-                    template += f"### Tool name: {tool['name']}\n"
-                    template += f"Description: {tool['description']}\n"
-                    template += f"Input JSON schema: {tool['schema']}\n"
-
-    # Add the full objective system prompt
-    template += """
+# General objective appended to every system prompt
+_GENERAL_OBJECTIVE = """
 # General Objective
 
 You accomplish a given task iteratively, breaking it down into clear steps and working through them methodically.
 
 """
 
-    return template
 
+@functools.lru_cache(maxsize=64)
+def _format_date(date):
+    """Format a date as YYYY-MM-DD without going through locale-aware strftime."""
+    if date.year < 1000:
+        # Zero-padding of %Y for such years is platform-dependent; keep strftime's
+        return date.strftime("%Y-%m-%d")
+    return f"{date.year}-{date.month:02d}-{date.day:02d}"
 
-def generate_no_mcp_system_prompt(date):
+
+# Maximum number of server definitions whose rendered blocks are cached
+RENDERED_BLOCKS_MAX_SIZE = 64
+
+
+@dataclass(slots=True, frozen=True)
+class _RenderedServerBlock:
+    """Rendered prompt section of a server definition, with the inputs it was rendered from."""
+
+    server: dict
+    inputs: tuple
+    text: str
+
+
+# id(server) -> _RenderedServerBlock, in least recently used order. Each entry
+# holds the server itself, so its id cannot be reused while it is cached.
+_rendered_blocks = OrderedDict()
+
+
+def _schema_text(tool):
     """
-    Generate a minimal system prompt without MCP tool definitions.
+    Return a tool's input schema as prompt text.
 
-    Used when no tools are available or when running in tool-less mode.
+    Dict schemas are rendered with str(), i.e. Python repr, which is the
+    format the models were trained on; producers that already hand in a
+    string are used as is.
+    """
+    schema = tool["schema"]
+    return schema if isinstance(schema, str) else str(schema)
 
-    Args:
-        date: Current date object for timestamp inclusion
 
-    Returns:
-        Basic system prompt string without tool definitions
+def _render_inputs(server):
+    """Everything a server's block is rendered from; compared by value to detect edits."""
+    return (
+        server["name"],
+        tuple(
+            (tool.get("name"), tool.get("description"), tool.get("schema"))
+            for tool in server.get("tools") or ()
+        ),
+    )
+
+
+def render_server_block(server):
     """
-    formatted_date = date.strftime("%Y-%m-%d")
+    Render one server's section of the MCP system prompt.
+
+    Blocks are cached per server definition so that long-lived definitions
+    (e.g. those shared across API requests) are formatted once. The server
+    dict itself is left untouched. A cached block is reused only while the
+    server's name and tools still equal a copy taken at render time, so
+    in-place edits are picked up as well. Tools that failed to load (they
+    only have an 'error' key) are skipped.
+    """
+    inputs = _render_inputs(server)
+    cached = _rendered_blocks.get(id(server))
+    if cached is not None and cached.server is server and cached.inputs == inputs:
+        _rendered_blocks.move_to_end(id(server))
+        return cached.text
+
+    block = f"\n## Server name: {server['name']}\n" + "".join(
+        f"### Tool name: {tool['name']}\n"
+        f"Description: {tool['description']}\n"
+        f"Input JSON schema: {_schema_text(tool)}\n"
+        for tool in _loaded_tools(server)
+    )
+    _rendered_blocks[id(server)] = _RenderedServerBlock(
+        server, copy.deepcopy(inputs), block
+    )
+    _rendered_blocks.move_to_end(id(server))
+    while len(_rendered_blocks) > RENDERED_BLOCKS_MAX_SIZE:
+        _rendered_blocks.popitem(last=False)
+    return block
 
-    # Start building the template, now follows https://docs.anthropic.com/en/docs/build-with-claude/tool-use/overview#tool-use-system-prompt
-    template = """In this environment you have access to a set of tools you can use to answer the user's question. """
 
-    template += f" Today is: {formatted_date}\n"
+# ============================================================================
+# Lazy Tool Catalog
+# ============================================================================
 
-    template += """
-Important Notes:
-- Tool-use must be placed **at the end** of your response, **top-level**, and not nested within other tags.
-- Always adhere to this format for the tool use to ensure proper parsing and execution.
+TOOL_CATALOG_SERVER_NAME = "tool-catalog"
+DESCRIBE_TOOL_NAME = "describe_tool"
+
+# Meta-tool listed in lazy prompts; the orchestrator answers it locally
+_TOOL_CATALOG_SERVER = {
+    "name": TOOL_CATALOG_SERVER_NAME,
+    "tools": [
+        {
+            "name": DESCRIBE_TOOL_NAME,
+            "description": "Return the description and input JSON schema of one of the tools listed above. Call it before using a tool for the first time.",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "server_name": {"title": "Server Name", "type": "string"},
+                    "tool_name": {"title": "Tool Name", "type": "string"},
+                },
+                "required": ["server_name", "tool_name"],
+                "title": "describe_toolArguments",
+            },
+        }
+    ],
+}
+
+
+def _loaded_tools(server):
+    """Tools of a server, skipping ones that failed to load (they only have an 'error' key)."""
+    return [
+        tool
+        for tool in server.get("tools") or ()
+        if not ("error" in tool and "name" not in tool)
+    ]
+
+
+def render_server_index(server):
+    """Render one server's section of a lazy prompt: tool names only, no schemas."""
+    tool_names = ", ".join(tool["name"] for tool in _loaded_tools(server))
+    return f"\n## Server name: {server['name']}\nTools: {tool_names}\n"
+
+
+def describe_tool(mcp_servers, server_name, tool_name):
+    """
+    Render the full definition of a tool, as it appears in an eager prompt.
 
-String and scalar parameters should be specified as is, while lists and objects should use JSON format. Note that spaces for string values are not stripped. The output is not expected to be valid XML and is parsed with regular expressions.
-"""
+    Returns None if the server or tool is unknown.
+    """
+    for server in mcp_servers or ():
+        if server["name"] != server_name:
+            continue
+        for tool in _loaded_tools(server):
+            if tool["name"] == tool_name:
+                return (
+                    f"### Tool name: {tool['name']}\n"
+                    f"Description: {tool['description']}\n"
+                    f"Input JSON schema: {_schema_text(tool)}\n"
+                )
+    return None
+
+
+def _iter_system_prompt(formatted_date, server_blocks=None):
+    """
+    Yield the fragments of a system prompt in order.
 
-    # Add the full objective system prompt
-    template += """
-# General Objective
+    server_blocks=None yields the tool-less prompt; otherwise the MCP
+    instructions are included, followed by the rendered server blocks.
+    """
+    if server_blocks is None:
+        yield _NO_MCP_PROMPT_HEAD
+        yield formatted_date
+        yield _NO_MCP_PROMPT_BODY
+    else:
+        yield _MCP_PROMPT_HEAD
+        yield formatted_date
+        yield _MCP_PROMPT_BODY
+        yield from server_blocks
+    yield _GENERAL_OBJECTIVE
 
-You accomplish a given task iteratively, breaking it down into clear steps and working through them methodically.
 
-"""
-    return template
+@functools.lru_cache(maxsize=32)
+def _build_system_prompt(formatted_date, server_blocks=None):
+    """Assemble a system prompt; cached since tool sets rarely change between calls."""
+    return "".join(_iter_system_prompt(formatted_date, server_blocks))
 
 
-def generate_agent_specific_system_prompt(agent_type=""):
+def _server_blocks(mcp_servers, lazy):
+    if lazy:
+        return (
+            *(render_server_index(server) for server in mcp_servers or ()),
+            render_server_block(_TOOL_CATALOG_SERVER),
+        )
+    return tuple(render_server_block(server) for server in mcp_servers or ())
+
+
+def generate_mcp_system_prompt(date, mcp_servers, lazy=False):
     """
-    Generate agent-specific objective prompts based on agent type.
+    Generate the MCP (Model Context Protocol) system prompt for LLM.
 
-    Different agent types have different objectives:
-    - main: Task-solving agent that uses tools to answer questions
-    - agent-browsing: Web search and browsing agent for information retrieval
+    Creates a structured prompt that instructs the LLM on how to use available
+    MCP tools. Includes tool definitions, XML formatting instructions, and
+    general task-solving guidelines. Prompts are memoized per date and tool set.
 
     Args:
-        agent_type: Type of agent ("main", "agent-browsing", or "browsing-agent")
+        date: Current date object for timestamp inclusion
+        mcp_servers: List of server definitions, each containing 'name' and 'tools'
+        lazy: If True, list only tool names per server plus the describe_tool
+            meta-tool, which returns a tool's schema on demand
 
     Returns:
-        Agent-specific objective prompt string
+        Complete system prompt string with tool definitions and usage instructions
+    """
+    return _build_system_prompt(_format_date(date), _server_blocks(mcp_servers, lazy))
+
+
+def generate_no_mcp_system_prompt(date):
+    """
+    Generate a minimal system prompt without MCP tool definitions.
+
+    Used when no tools are available or when running in tool-less mode.
+
+    Args:
+        date: Current date object for timestamp inclusion
+
+    Returns:
+        Basic system prompt string without tool definitions
     """
-    if agent_type == "main":
-        system_prompt = """\n
+    return _build_system_prompt(_format_date(date))
+
+
+def clear_prompt_cache():
+    """Drop all memoized system prompts, e.g. after prompt fragments are patched."""
+    _build_system_prompt.cache_clear()
+    _rendered_blocks.clear()
+
+
+# ============================================================================
+# Agent-Specific Objectives
+# ============================================================================
+
+_MAIN_AGENT_OBJECTIVE = """\n
 # Agent Specific Objective
 
 You are a task-solving agent that uses tools step-by-step to gather information for the user's question.
@@ -281,15 +516,122 @@ When conversation history or previous context is provided:
 You will be explicitly asked to provide a final summary later. For now, focus ONLY on gathering comprehensive information.
 
 """
-    elif agent_type == "agent-browsing" or agent_type == "browsing-agent":
-        system_prompt = """# Agent Specific Objective
+
+_BROWSING_AGENT_OBJECTIVE = """# Agent Specific Objective
 
 You are an agent that performs the task of searching and browsing the web for specific information and generating the desired answer. Your task is to retrieve reliable, factual, and verifiable information that fills in knowledge gaps.
 Do not infer, speculate, summarize broadly, or attempt to fill in missing parts yourself. Only return factual content.
 """
-    else:
-        raise ValueError(f"Unknown agent type: {agent_type}")
-    return system_prompt.strip()
+
+# Stripped once at import; "browsing-agent" is an alias of "agent-browsing"
+_AGENT_SPECIFIC_PROMPTS = {
+    "main": _MAIN_AGENT_OBJECTIVE.strip(),
+    "agent-browsing": _BROWSING_AGENT_OBJECTIVE.strip(),
+    "browsing-agent": _BROWSING_AGENT_OBJECTIVE.strip(),
+}
+
+
+def generate_agent_specific_system_prompt(agent_type=""):
+    """
+    Generate agent-specific objective prompts based on agent type.
+
+    Different agent types have different objectives:
+    - main: Task-solving agent that uses tools to answer questions
+    - agent-browsing: Web search and browsing agent for information retrieval
+
+    Args:
+        agent_type: Type of agent ("main", "agent-browsing", or "browsing-agent")
+
+    Returns:
+        Agent-specific objective prompt string
+    """
+    try:
+        return _AGENT_SPECIFIC_PROMPTS[agent_type]
+    except KeyError:
+        raise ValueError(f"Unknown agent type: {agent_type}") from None
+
+
+# ============================================================================
+# Summary Prompt Templates
+# ============================================================================
+
+# Adjacent literals are folded into one constant at compile time; the texts are
+# stripped and split at the placeholder once at import, so each call is one join
+_MAIN_SUMMARIZE_TEXT = (
+    "# 角色转换：从研究助手到用户顾问\n\n"
+    "前面你是一个研究助手，负责搜集信息、调用工具、分析数据。\n"
+    "现在，你的角色变了——你是**用户的顾问**，需要将研究成果整理成清晰、人性化的答案呈现给用户。\n\n"
+    "## 你的新定位\n\n"
+    "✅ **你现在是**：\n"
+    "- 面向用户的信息整理者和顾问\n"
+    "- 将复杂的研究过程转化为易懂答案的专家\n"
+    "- 用户的可信赖信息来源\n\n"
+    "❌ **你不再是**：\n"
+    "- 研究执行者（不要再提工具调用、访问失败等技术细节）\n"
+    "- 决策者（不要说\"需要继续搜索\"、\"应该访问XX网站\"）\n"
+    "- 过程记录者（不要列出尝试了什么、失败了什么）\n\n"
+    "## 用户的问题\n\n"
+    '"$task_description"\n\n'
+    "## 如何回答用户\n\n"
+    "**1. 心态转换**\n"
+    "- 想象你正在和用户面对面交流，用自然、专业的语气\n"
+    "- 关注用户关心的**结果和洞察**，而不是你的研究过程\n"
+    "- 即使信息不完整，也要给出你能给的最佳答案\n\n"
+    "**2. 内容组织**\n"
+    "- 用清晰的结构（标题、列表、分段）让答案易读\n"
+    "- 先给核心答案，再展开细节\n"
+    "- 如果某些信息未获取到，简要说明并给出已有信息即可\n\n"
+    "**3. 禁止事项**\n"
+    "❌ 不要输出技术过程：\"先调用XX工具\"、\"访问XX网站失败\"\n"
+    "❌ 不要输出工具标签：<use_mcp_tool>、server_name tool_name 等\n"
+    "❌ 不要说\"需要进一步搜索\"、\"建议访问XX\"\n"
+    "❌ 不要列举失败的尝试：这是技术细节，用户不关心\n\n"
+    "**4. 引用来源**（非常重要）\n"
+    "使用以下格式引用信息来源：\n"
+    "<researchrefsource data-ids=\"[N]\"></researchrefsource>\n\n"
+    "示例：\n"
+    "- 单个来源：产值2.5万亿<researchrefsource data-ids=\"[7]\"></researchrefsource>\n"
+    "- 多个来源：根据数据<researchrefsource data-ids=\"[1,2,7]\"></researchrefsource>\n\n"
+    "❌ 错误格式：[1]、[7]、(来源1)、¹\n"
+    "✅ 正确格式：<researchrefsource data-ids=\"[N]\"></researchrefsource>\n\n"
+    "## 示例对比\n\n"
+    "❌ **不好的回答**（研究者视角）：\n"
+    "\\\"尝试访问了新浪财经但失败了，东方财富也超时了。先调用scrape_and_extract_info访问估值页面。\\n"
+    "jina_scrape_llm_summary scrape_and_extract_info {...}\\\"\n\n"
+    "✅ **好的回答**（顾问视角）：\n"
+    "\\\"蓝色光标是中国领先的数字营销服务商<researchrefsource data-ids=\\\"[1]\\\"></researchrefsource>。\\n"
+    "根据最新数据，公司2024年Q3营收实现增长<researchrefsource data-ids=\\\"[2]\\\"></researchrefsource>。\\n"
+    "关于详细的财务估值数据，目前公开渠道信息有限，建议关注公司财报发布。\\\"\n\n"
+    "---\n\n"
+    "现在，请以**用户顾问**的身份，用人性化、逻辑清晰的方式回答用户的问题。"
+)
+
+_BROWSING_SUMMARIZE_TEXT = (
+    "This is a direct instruction to you (the assistant), not the result of a tool call.\n\n"
+    "We are now ending this session, and your conversation history will be deleted. "
+    "You must NOT initiate any further tool use. This is your final opportunity to report "
+    "*all* of the information gathered during the session.\n\n"
+    "The original task is repeated here for reference:\n\n"
+    '"$task_description"\n\n'
+    "Summarize the above search and browsing history. Output the FINAL RESPONSE and detailed supporting information of the task given to you.\n\n"
+    "If you found any useful facts, data, quotes, or answers directly relevant to the original task, include them clearly and completely.\n"
+    "If you reached a conclusion or answer, include it as part of the response.\n"
+    "If the task could not be fully answered, do NOT make up any content. Instead, return all partially relevant findings, "
+    "Search results, quotes, and observations that might help a downstream agent solve the problem.\n"
+    "If partial, conflicting, or inconclusive information was found, clearly indicate this in your response.\n\n"
+    "Your final response should be a clear, complete, and structured report.\n"
+    "Organize the content into logical sections with appropriate headings.\n"
+    "Do NOT include any tool call instructions, speculative filler, or vague summaries.\n"
+    "Focus on factual, specific, and well-organized information."
+)
+
+# (prefix, suffix) around the task description, split once at import
+_SUMMARIZE_PARTS = {
+    "main": tuple(_MAIN_SUMMARIZE_TEXT.strip().split("$task_description")),
+    "agent-browsing": tuple(
+        _BROWSING_SUMMARIZE_TEXT.strip().split("$task_description")
+    ),
+}
 
 
 def generate_agent_summarize_prompt(task_description, agent_type=""):
@@ -308,75 +650,9 @@ def generate_agent_summarize_prompt(task_description, agent_type=""):
     Returns:
         Summarization prompt string with formatting instructions
     """
-    if agent_type == "main":
-        summarize_prompt = (
-            "# 角色转换：从研究助手到用户顾问\n\n"
-            "前面你是一个研究助手，负责搜集信息、调用工具、分析数据。\n"
-            "现在，你的角色变了——你是**用户的顾问**，需要将研究成果整理成清晰、人性化的答案呈现给用户。\n\n"
-            "## 你的新定位\n\n"
-            "✅ **你现在是**：\n"
-            "- 面向用户的信息整理者和顾问\n"
-            "- 将复杂的研究过程转化为易懂答案的专家\n"
-            "- 用户的可信赖信息来源\n\n"
-            "❌ **你不再是**：\n"
-            "- 研究执行者（不要再提工具调用、访问失败等技术细节）\n"
-            "- 决策者（不要说\"需要继续搜索\"、\"应该访问XX网站\"）\n"
-            "- 过程记录者（不要列出尝试了什么、失败了什么）\n\n"
-            "## 用户的问题\n\n"
-            f'"{task_description}"\n\n'
-            "## 如何回答用户\n\n"
-            "**1. 心态转换**\n"
-            "- 想象你正在和用户面对面交流，用自然、专业的语气\n"
-            "- 关注用户关心的**结果和洞察**，而不是你的研究过程\n"
-            "- 即使信息不完整，也要给出你能给的最佳答案\n\n"
-            "**2. 内容组织**\n"
-            "- 用清晰的结构（标题、列表、分段）让答案易读\n"
-            "- 先给核心答案，再展开细节\n"
-            "- 如果某些信息未获取到，简要说明并给出已有信息即可\n\n"
-            "**3. 禁止事项**\n"
-            "❌ 不要输出技术过程：\"先调用XX工具\"、\"访问XX网站失败\"\n"
-            "❌ 不要输出工具标签：<use_mcp_tool>、server_name tool_name 等\n"
-            "❌ 不要说\"需要进一步搜索\"、\"建议访问XX\"\n"
-            "❌ 不要列举失败的尝试：这是技术细节，用户不关心\n\n"
-            "**4. 引用来源**（非常重要）\n"
-            "使用以下格式引用信息来源：\n"
-            "<researchrefsource data-ids=\"[N]\"></researchrefsource>\n\n"
-            "示例：\n"
-            "- 单个来源：产值2.5万亿<researchrefsource data-ids=\"[7]\"></researchrefsource>\n"
-            "- 多个来源：根据数据<researchrefsource data-ids=\"[1,2,7]\"></researchrefsource>\n\n"
-            "❌ 错误格式：[1]、[7]、(来源1)、¹\n"
-            "✅ 正确格式：<researchrefsource data-ids=\"[N]\"></researchrefsource>\n\n"
-            "## 示例对比\n\n"
-            "❌ **不好的回答**（研究者视角）：\n"
-            "\\\"尝试访问了新浪财经但失败了，东方财富也超时了。先调用scrape_and_extract_info访问估值页面。\\n"
-            "jina_scrape_llm_summary scrape_and_extract_info {...}\\\"\n\n"
-            "✅ **好的回答**（顾问视角）：\n"
-            "\\\"蓝色光标是中国领先的数字营销服务商<researchrefsource data-ids=\\\"[1]\\\"></researchrefsource>。\\n"
-            "根据最新数据，公司2024年Q3营收实现增长<researchrefsource data-ids=\\\"[2]\\\"></researchrefsource>。\\n"
-            "关于详细的财务估值数据，目前公开渠道信息有限，建议关注公司财报发布。\\\"\n\n"
-            "---\n\n"
-            "现在，请以**用户顾问**的身份，用人性化、逻辑清晰的方式回答用户的问题。"
-        )
-    elif agent_type == "agent-browsing":
-        summarize_prompt = (
-            "This is a direct instruction to you (the assistant), not the result of a tool call.\n\n"
-            "We are now ending this session, and your conversation history will be deleted. "
-            "You must NOT initiate any further tool use. This is your final opportunity to report "
-            "*all* of the information gathered during the session.\n\n"
-            "The original task is repeated here for reference:\n\n"
-            f'"{task_description}"\n\n'
-            "Summarize the above search and browsing history. Output the FINAL RESPONSE and detailed supporting information of the task given to you.\n\n"
-            "If you found any useful facts, data, quotes, or answers directly relevant to the original task, include them clearly and completely.\n"
-            "If you reached a conclusion or answer, include it as part of the response.\n"
-            "If the task could not be fully answered, do NOT make up any content. Instead, return all partially relevant findings, "
-            "Search results, quotes, and observations that might help a downstream agent solve the problem.\n"
-            "If partial, conflicting, or inconclusive information was found, clearly indicate this in your response.\n\n"
-            "Your final response should be a clear, complete, and structured report.\n"
-            "Organize the content into logical sections with appropriate headings.\n"
-            "Do NOT include any tool call instructions, speculative filler, or vague summaries.\n"
-            "Focus on factual, specific, and well-organized information."
-        )
-    else:
-        raise ValueError(f"Unknown agent type: {agent_type}")
+    try:
+        prefix, suffix = _SUMMARIZE_PARTS[agent_type]
+    except KeyError:
+        raise ValueError(f"Unknown agent type: {agent_type}") from None
 
-    return summarize_prompt.strip()
+    return "".join((prefix, task_description, suffix))
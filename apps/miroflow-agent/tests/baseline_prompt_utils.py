@@ -0,0 +1,128 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+"""
+The system prompt builders as they were before prompts were memoized.
+
+Kept verbatim as a reference: the memoized builders in src.utils.prompt_utils
+must produce byte-for-byte identical prompts.
+"""
+
+
+def generate_mcp_system_prompt(date, mcp_servers):
+    """
+    Generate the MCP (Model Context Protocol) system prompt for LLM.
+
+    Creates a structured prompt that instructs the LLM on how to use available
+    MCP tools. Includes tool definitions, XML formatting instructions, and
+    general task-solving guidelines.
+
+    Args:
+        date: Current date object for timestamp inclusion
+        mcp_servers: List of server definitions, each containing 'name' and 'tools'
+
+    Returns:
+        Complete system prompt string with tool definitions and usage instructions
+    """
+    formatted_date = date.strftime("%Y-%m-%d")
+
+    # Start building the template, now follows https://docs.anthropic.com/en/docs/build-with-claude/tool-use/overview#tool-use-system-prompt
+    template = f"""In this environment you have access to a set of tools you can use to answer the user's question. 
+
+You only have access to the tools provided below. You can only use one tool per message, and will receive the result of that tool in the user's next response. You use tools step-by-step to accomplish a given task, with each tool-use informed by the result of the previous tool-use. Today is: {formatted_date}
+
+# Tool-Use Formatting Instructions 
+
+Tool-use is formatted using XML-style tags. The tool-use is enclosed in <use_mcp_tool></use_mcp_tool> and each parameter is similarly enclosed within its own set of tags.
+
+The Model Context Protocol (MCP) connects to servers that provide additional tools and resources to extend your capabilities. You can use the server's tools via the `use_mcp_tool`.
+
+Description: 
+Request to use a tool provided by a MCP server. Each MCP server can provide multiple tools with different capabilities. Tools have defined input schemas that specify required and optional parameters.
+
+Parameters:
+- server_name: (required) The name of the MCP server providing the tool
+- tool_name: (required) The name of the tool to execute
+- arguments: (required) A JSON object containing the tool's input parameters, following the tool's input schema, quotes within string must be properly escaped, ensure it's valid JSON
+
+Usage:
+<use_mcp_tool>
+<server_name>server name here</server_name>
+<tool_name>tool name here</tool_name>
+<arguments>
+{{
+"param1": "value1",
+"param2": "value2 \\"escaped string\\""
+}}
+</arguments>
+</use_mcp_tool>
+
+Important Notes:
+- Tool-use must be placed **at the end** of your response, **top-level**, and not nested within other tags.
+- Always adhere to this format for the tool use to ensure proper parsing and execution.
+
+String and scalar parameters should be specified as is, while lists and objects should use JSON format. Note that spaces for string values are not stripped. The output is not expected to be valid XML and is parsed with regular expressions.
+Here are the functions available in JSONSchema format:
+
+"""
+
+    # Add MCP servers section
+    if mcp_servers and len(mcp_servers) > 0:
+        for server in mcp_servers:
+            template += f"\n## Server name: {server['name']}\n"
+
+            if "tools" in server and len(server["tools"]) > 0:
+                for tool in server["tools"]:
+                    # Skip tools that failed to load (they only have 'error' key)
+                    if "error" in tool and "name" not in tool:
+                        continue
+                    template += f"### Tool name: {tool['name']}\n"
+                    template += f"Description: {tool['description']}\n"
+                    template += f"Input JSON schema: {tool['schema']}\n"
+
+    # Add the full objective system prompt
+    template += """
+# General Objective
+
+You accomplish a given task iteratively, breaking it down into clear steps and working through them methodically.
+
+"""
+
+    return template
+
+
+def generate_no_mcp_system_prompt(date):
+    """
+    Generate a minimal system prompt without MCP tool definitions.
+
+    Used when no tools are available or when running in tool-less mode.
+
+    Args:
+        date: Current date object for timestamp inclusion
+
+    Returns:
+        Basic system prompt string without tool definitions
+    """
+    formatted_date = date.strftime("%Y-%m-%d")
+
+    # Start building the template, now follows https://docs.anthropic.com/en/docs/build-with-claude/tool-use/overview#tool-use-system-prompt
+    template = """In this environment you have access to a set of tools you can use to answer the user's question. """
+
+    template += f" Today is: {formatted_date}\n"
+
+    template += """
+Important Notes:
+- Tool-use must be placed **at the end** of your response, **top-level**, and not nested within other tags.
+- Always adhere to this format for the tool use to ensure proper parsing and execution.
+
+String and scalar parameters should be specified as is, while lists and objects should use JSON format. Note that spaces for string values are not stripped. The output is not expected to be valid XML and is parsed with regular expressions.
+"""
+
+    # Add the full objective system prompt
+    template += """
+# General Objective
+
+You accomplish a given task iteratively, breaking it down into clear steps and working through them methodically.
+
+"""
+    return template
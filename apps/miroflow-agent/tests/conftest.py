@@ -0,0 +1,48 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+import pytest
+from omegaconf import OmegaConf
+
+from src.llm.providers.openai_client import OpenAIClient
+from src.logging.task_logger import TaskLog
+
+
+def make_cfg(keep_tool_result_stride=1, **llm_overrides):
+    """Minimal config for an OpenAI-compatible client, as composed by Hydra."""
+    llm = {
+        "provider": "openai",
+        "model_name": "test-model",
+        "async_client": True,
+        "temperature": 0.3,
+        "top_p": 1.0,
+        "min_p": 0.0,
+        "top_k": -1,
+        "max_tokens": 4096,
+        "max_context_length": 200000,
+        "api_key": "test-key",
+        "base_url": "http://127.0.0.1:9/v1",
+        "retry_budget_seconds": 180,
+    }
+    llm.update(llm_overrides)
+    return OmegaConf.create(
+        {
+            "llm": llm,
+            "agent": {
+                "keep_tool_result": -1,
+                "keep_tool_result_stride": keep_tool_result_stride,
+            },
+        }
+    )
+
+
+@pytest.fixture
+def make_openai_client(tmp_path):
+    def make(**overrides):
+        return OpenAIClient(
+            task_id="test-task",
+            cfg=make_cfg(**overrides),
+            task_log=TaskLog(log_dir=str(tmp_path)),
+        )
+
+    return make
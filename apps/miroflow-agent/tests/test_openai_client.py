@@ -0,0 +1,213 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm import base_client
+from src.llm.providers.openai_client import OpenAIClient
+
+
+@pytest.mark.asyncio
+async def test_shared_async_http_client_is_closed_by_its_last_user(
+    make_openai_client,
+):
+    first = make_openai_client()
+    second = make_openai_client()
+    http_client = first.client._client
+    assert second.client._client is http_client
+
+    await first.aclose()
+    assert not http_client.is_closed
+
+    await second.aclose()
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_the_streaming_companion_of_a_sync_client(
+    make_openai_client,
+):
+    llm_client = make_openai_client(async_client=False)
+    stream_http_client = llm_client._get_async_stream_client()._client
+
+    await llm_client.aclose()
+
+    assert stream_http_client.is_closed
+    # The sync pool is shared process-wide and stays open
+    assert not llm_client.client._client.is_closed
+
+
+def make_stream_chunk(content, finish_reason=None):
+    delta = SimpleNamespace(content=content, role="assistant")
+    return SimpleNamespace(
+        id="chatcmpl-test",
+        created=0,
+        model="test-model",
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)],
+        usage=None,
+    )
+
+
+class FakeStreamClient:
+    """Stands in for AsyncOpenAI; every request streams the given chunks."""
+
+    def __init__(self, chunks):
+        self.chat = SimpleNamespace(completions=self)
+        self.chunks = chunks
+
+    async def create(self, **params):
+        async def stream():
+            for chunk in self.chunks:
+                yield chunk
+
+        return stream()
+
+
+@pytest.mark.asyncio
+async def test_truncated_stream_retries_only_within_the_retry_budget(
+    make_openai_client,
+):
+    llm_client = make_openai_client()
+    llm_client.client = FakeStreamClient(
+        [make_stream_chunk("partial "), make_stream_chunk("answer", "length")]
+    )
+
+    # Attempts left and time left: retry
+    response = await llm_client._handle_streaming_response(
+        {}, [], attempt=0, max_retries=3, deadline=time.monotonic() + 60
+    )
+    assert response is None
+
+    # Attempts left, but the budget is spent: keep the truncated answer
+    response = await llm_client._handle_streaming_response(
+        {}, [], attempt=0, max_retries=3, deadline=time.monotonic() - 1
+    )
+    assert response.choices[0].message.content == "partial answer"
+    assert response.choices[0].finish_reason == "length"
+    await llm_client.aclose()
+
+
+class CollidingStr(str):
+    def __hash__(self):
+        return 0
+
+
+class FakeEncoding:
+    """One token per word, without downloading a tiktoken vocabulary."""
+
+    def encode(self, text):
+        return text.split()
+
+
+def test_token_counts_are_not_shared_by_colliding_hashes(
+    make_openai_client, monkeypatch
+):
+    monkeypatch.setattr(base_client, "get_encoding", lambda name: FakeEncoding())
+    llm_client = make_openai_client()
+    short, long = CollidingStr("one two"), CollidingStr("one two three")
+    assert hash(short) == hash(long)
+
+    assert llm_client._count_tokens_cached(short) == 2
+    assert llm_client._count_tokens_cached(long) == 3
+    assert llm_client._count_tokens_cached(short) == 2
+
+
+def make_tool_history(num_tool_results):
+    messages = [{"role": "user", "content": "task"}]
+    for i in range(num_tool_results):
+        messages.append({"role": "assistant", "content": f"call {i}"})
+        messages.append({"role": "user", "content": f"result {i}"})
+    return messages
+
+
+def omitted_results(messages):
+    return [
+        msg["content"]
+        for msg in messages[1:]
+        if msg["role"] == "user" and msg["content"] == base_client._OMITTED_OPENAI
+    ]
+
+
+@pytest.mark.parametrize("num_tool_results", range(1, 12))
+def test_tool_results_are_omitted_in_whole_strides(
+    make_openai_client, num_tool_results
+):
+    llm_client = make_openai_client(keep_tool_result_stride=3)
+    messages = make_tool_history(num_tool_results)
+
+    filtered = llm_client._remove_tool_result_from_messages(messages, 2)
+
+    num_omitted = len(omitted_results(filtered))
+    num_kept = num_tool_results - num_omitted
+    assert num_omitted % 3 == 0
+    assert min(2, num_tool_results) <= num_kept < 2 + 3
+    # The oldest results are the ones omitted; everything else is shared
+    for original, message in zip(messages, filtered):
+        if message["content"] == base_client._OMITTED_OPENAI:
+            assert original["content"] in {f"result {i}" for i in range(num_omitted)}
+        else:
+            assert message is original
+
+
+def test_omitted_prefix_changes_once_per_stride(make_openai_client):
+    llm_client = make_openai_client(keep_tool_result_stride=3)
+    num_omitted = []
+    for num_tool_results in range(2, 12):
+        filtered = llm_client._remove_tool_result_from_messages(
+            make_tool_history(num_tool_results), 2
+        )
+        num_omitted.append(len(omitted_results(filtered)))
+
+    assert num_omitted == [0, 0, 0, 3, 3, 3, 6, 6, 6, 9]
+
+
+def test_stride_one_keeps_exactly_the_last_results(make_openai_client):
+    llm_client = make_openai_client()
+
+    filtered = llm_client._remove_tool_result_from_messages(make_tool_history(5), 2)
+
+    assert [msg["content"] for msg in filtered if msg["role"] == "user"] == [
+        "task",
+        *[base_client._OMITTED_OPENAI] * 3,
+        "result 3",
+        "result 4",
+    ]
+
+
+def baseline_has_severe_repeat(content):
+    return content.count(content[-50:]) > 5
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "short",
+        "a" * 299,
+        "a" * 300,
+        "a" * 349,
+        "ab" * 150,
+        "ab" * 149 + "a",
+        "x" * 1000 + "".join(f"line {i}\n" for i in range(100)),
+        "intro " + "The same sentence over and over again. " * 6,
+        "intro " + "The same sentence over and over again. " * 7,
+    ],
+)
+def test_severe_repeat_matches_the_baseline_count(content):
+    assert OpenAIClient._has_severe_repeat(content) == baseline_has_severe_repeat(
+        content
+    )
+
+
+def test_severe_repeat_matches_the_baseline_count_on_random_text():
+    rng = random.Random(0)
+    for _ in range(500):
+        unit = "".join(rng.choice("ab ") for _ in range(rng.randint(1, 60)))
+        content = unit * rng.randint(1, 20)
+        assert OpenAIClient._has_severe_repeat(content) == baseline_has_severe_repeat(
+            content
+        ), content
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+import pytest
+
+from src.core.orchestrator import Orchestrator
+from src.io.output_formatter import OutputFormatter
+from src.logging.task_logger import TaskLog
+from src.utils.prompt_utils import DESCRIBE_TOOL_NAME, TOOL_CATALOG_SERVER_NAME
+
+from .conftest import make_cfg
+
+TOOL_DEFINITIONS = [
+    {
+        "name": "search",
+        "tools": [
+            {
+                "name": "google_search",
+                "description": "Search the web.",
+                "schema": {"type": "object", "properties": {"q": {"type": "string"}}},
+            }
+        ],
+    }
+]
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    cfg = make_cfg()
+    cfg.agent.lazy_tool_schemas = True
+    return Orchestrator(
+        main_agent_tool_manager=None,
+        sub_agent_tool_managers={},
+        llm_client=None,
+        output_formatter=OutputFormatter(),
+        cfg=cfg,
+        task_log=TaskLog(log_dir=str(tmp_path)),
+    )
+
+
+def test_describe_tool_call_returns_the_tool_definition(orchestrator):
+    result = orchestrator._describe_tool_call(
+        TOOL_DEFINITIONS,
+        DESCRIBE_TOOL_NAME,
+        {"server_name": "search", "tool_name": "google_search"},
+    )
+
+    assert result == {
+        "server_name": TOOL_CATALOG_SERVER_NAME,
+        "tool_name": DESCRIBE_TOOL_NAME,
+        "result": "### Tool name: google_search\n"
+        "Description: Search the web.\n"
+        "Input JSON schema: {'type': 'object', 'properties': "
+        "{'q': {'type': 'string'}}}\n",
+    }
+
+
+def test_describe_tool_call_reports_unknown_tools(orchestrator):
+    result = orchestrator._describe_tool_call(
+        TOOL_DEFINITIONS,
+        DESCRIBE_TOOL_NAME,
+        {"server_name": "search", "tool_name": "sogou_search"},
+    )
+
+    assert result["error"] == "Unknown tool 'sogou_search' on server 'search'."
+    assert "result" not in result
+
+
+@pytest.mark.parametrize("tool_name", ["google_search", "list_tools", ""])
+def test_describe_tool_call_rejects_other_catalog_tools(orchestrator, tool_name):
+    result = orchestrator._describe_tool_call(
+        TOOL_DEFINITIONS,
+        tool_name,
+        {"server_name": "search", "tool_name": "google_search"},
+    )
+
+    assert result == {
+        "server_name": TOOL_CATALOG_SERVER_NAME,
+        "tool_name": tool_name,
+        "error": f"Tool '{tool_name}' not found on server '{TOOL_CATALOG_SERVER_NAME}'.",
+    }
@@ -0,0 +1,68 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+import json
+
+import pytest
+
+from src.io.output_formatter import TOOL_RESULT_MAX_LENGTH, OutputFormatter
+
+
+def make_search_result(links, snippet=""):
+    organic = [
+        {"title": f"Title {i}", "link": link, "snippet": snippet}
+        for i, link in enumerate(links)
+    ]
+    return json.dumps({"organic": organic})
+
+
+def test_oversized_search_results_are_indexed():
+    formatter = OutputFormatter()
+    links = [f"https://example.com/{i}" for i in range(3)]
+    result = make_search_result(links, snippet="x" * TOOL_RESULT_MAX_LENGTH)
+    assert len(result) > TOOL_RESULT_MAX_LENGTH * 2
+
+    message = formatter.format_tool_result_for_user(
+        {"server_name": "search", "tool_name": "google_search", "result": result}
+    )
+
+    assert message["text"].startswith("Search Results (cite using [index]):")
+    assert "[3] Title: Title 2" in message["text"]
+    assert formatter.seen_urls == set(links)
+
+
+def test_oversized_other_results_are_truncated():
+    formatter = OutputFormatter()
+    result = "x" * (TOOL_RESULT_MAX_LENGTH * 3)
+
+    message = formatter.format_tool_result_for_user(
+        {"server_name": "reader", "tool_name": "scrape", "result": result}
+    )
+
+    assert message["text"] == (
+        "x" * TOOL_RESULT_MAX_LENGTH + "\n... [Result truncated]"
+    )
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (r"The answer is \boxed{42}.", "42"),
+        (r"\boxed{\frac{1}{2}}", r"\frac{1}{2}"),
+        (r"\boxed{ {a, {b}} }", "{a, {b}}"),
+        (r"\boxed{\{x\} \cup \{y\}}", r"\{x\} \cup \{y\}"),
+        (r"\boxed {spaced}", "spaced"),
+        (r"\boxed{first} then \boxed{second}", "second"),
+        (r"\boxed{unclosed {nested}", "unclosed {nested}"),
+        ("no boxed answer", ""),
+        ("", ""),
+    ],
+)
+def test_extract_boxed_content(text, expected):
+    assert OutputFormatter()._extract_boxed_content(text) == expected
+
+
+def test_extract_boxed_content_in_long_answers():
+    text = "reasoning " * 100_000 + r"\boxed{" + "{x}" * 10_000 + "}"
+
+    assert OutputFormatter()._extract_boxed_content(text) == "{x}" * 10_000
@@ -0,0 +1,93 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.parsing_utils import (
+    parse_llm_response_for_tool_calls,
+    parse_mcp_tool_block,
+    safe_json_loads,
+)
+
+MCP_RESPONSE = """<think>Look it up.</think>
+Searching now.
+
+<use_mcp_tool>
+<server_name> search </server_name>
+<tool_name>google_search</tool_name>
+<arguments>
+{"q": "MCP \\"spec\\"", "num": null}
+</arguments>
+</use_mcp_tool>"""
+
+
+def test_parse_mcp_tool_block():
+    assert parse_mcp_tool_block(MCP_RESPONSE) == {
+        "server_name": "search",
+        "tool_name": "google_search",
+        "arguments": {"q": 'MCP "spec"'},
+        "id": None,
+    }
+
+
+def test_parse_mcp_tool_block_returns_the_first_block():
+    second = MCP_RESPONSE.replace("google_search", "sogou_search")
+
+    assert parse_mcp_tool_block(MCP_RESPONSE + second)["tool_name"] == ("google_search")
+    assert [
+        call["tool_name"]
+        for call in parse_llm_response_for_tool_calls(MCP_RESPONSE + second)
+    ] == ["google_search", "sogou_search"]
+
+
+def test_parse_mcp_tool_block_without_a_complete_block():
+    assert parse_mcp_tool_block("No tools needed.") is None
+    assert parse_mcp_tool_block(MCP_RESPONSE[: -len("</use_mcp_tool>")]) is None
+
+
+def test_parse_mcp_tool_block_repairs_invalid_arguments():
+    text = MCP_RESPONSE.replace('"num": null}', '"num": 5,}')
+
+    assert parse_mcp_tool_block(text)["arguments"] == {"q": 'MCP "spec"', "num": 5}
+
+
+def test_large_integer_arguments_keep_their_exact_value():
+    arguments = '{"id": 123456789012345678901234567890, "ratio": 0.1}'
+    text = MCP_RESPONSE.replace('{"q": "MCP \\"spec\\"", "num": null}', arguments)
+
+    assert parse_mcp_tool_block(text)["arguments"] == {
+        "id": 123456789012345678901234567890,
+        "ratio": 0.1,
+    }
+    assert safe_json_loads(arguments)["id"] == 123456789012345678901234567890
+
+
+def make_tool_call(arguments):
+    return SimpleNamespace(
+        id="call_1",
+        function=SimpleNamespace(name="search-google_search", arguments=arguments),
+    )
+
+
+@pytest.mark.parametrize(
+    "arguments", ['{"q": "foo bar', '{"a": 1, "b": tr', '{"q": "abc", "num": 3']
+)
+def test_truncated_tool_call_arguments_are_not_executed(arguments):
+    (tool_call,) = parse_llm_response_for_tool_calls([make_tool_call(arguments)])
+
+    assert tool_call == {
+        "server_name": "search",
+        "tool_name": "google_search",
+        "arguments": {"error": "Failed to parse arguments", "raw": arguments},
+        "id": "call_1",
+    }
+
+
+def test_python_dict_tool_call_arguments_are_fixed():
+    (tool_call,) = parse_llm_response_for_tool_calls(
+        [make_tool_call("{'q': 'abc', 'safe': True, 'gl': None}")]
+    )
+
+    assert tool_call["arguments"] == {"q": "abc", "safe": True}
@@ -0,0 +1,214 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+import copy
+import datetime
+
+import pytest
+
+from src.utils.prompt_utils import (
+    _TOOL_CATALOG_SERVER,
+    DESCRIBE_TOOL_NAME,
+    TOOL_CATALOG_SERVER_NAME,
+    describe_tool,
+    find_refusal_keywords,
+    generate_mcp_system_prompt,
+    generate_no_mcp_system_prompt,
+    is_refusal,
+    render_server_block,
+)
+
+from . import baseline_prompt_utils
+
+SEARCH_SERVER = {
+    "name": "search",
+    "tools": [
+        {
+            "name": "google_search",
+            "description": "Search the web.",
+            "schema": {
+                "type": "object",
+                "properties": {"q": {"title": "Q", "type": "string"}},
+                "required": ["q"],
+            },
+        },
+        {"error": "Unable to fetch tools"},
+    ],
+}
+
+
+def test_render_server_block_leaves_the_definition_untouched():
+    server = copy.deepcopy(SEARCH_SERVER)
+
+    block = render_server_block(server)
+
+    assert server == SEARCH_SERVER
+    assert block == (
+        "\n## Server name: search\n"
+        "### Tool name: google_search\n"
+        "Description: Search the web.\n"
+        "Input JSON schema: {'type': 'object', 'properties': "
+        "{'q': {'title': 'Q', 'type': 'string'}}, 'required': ['q']}\n"
+    )
+    assert render_server_block(server) == block
+
+
+def test_render_server_block_picks_up_in_place_edits():
+    server = copy.deepcopy(SEARCH_SERVER)
+    render_server_block(server)
+
+    server["tools"][0]["description"] = "Search the web with Google."
+    assert "Description: Search the web with Google.\n" in render_server_block(server)
+
+    server["tools"][0]["schema"]["properties"]["q"]["type"] = "array"
+    assert "'type': 'array'" in render_server_block(server)
+
+    server["tools"][1] = {**server["tools"][0], "name": "sogou_search"}
+    assert "### Tool name: sogou_search\n" in render_server_block(server)
+
+
+BROWSER_SERVER = {
+    "name": "browser",
+    "tools": [
+        {
+            "name": "scrape",
+            "description": "Fetch a page as markdown, with {braces} and \\escapes.",
+            "schema": '{"type": "object", "properties": {"url": {"type": "string"}}}',
+        }
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "mcp_servers",
+    [
+        [],
+        [SEARCH_SERVER],
+        [SEARCH_SERVER, BROWSER_SERVER],
+        [{"name": "empty", "tools": []}],
+    ],
+)
+@pytest.mark.parametrize(
+    "date", [datetime.date(2025, 1, 9), datetime.datetime(999, 12, 31, 23, 59)]
+)
+def test_mcp_system_prompt_matches_the_baseline_builder(date, mcp_servers):
+    expected = baseline_prompt_utils.generate_mcp_system_prompt(date, mcp_servers)
+
+    assert generate_mcp_system_prompt(date, mcp_servers) == expected
+    # Memoized prompts are identical too
+    assert generate_mcp_system_prompt(date, mcp_servers) == expected
+
+
+def test_memoized_mcp_system_prompt_follows_edited_tools():
+    date = datetime.date(2025, 1, 9)
+    server = copy.deepcopy(SEARCH_SERVER)
+    generate_mcp_system_prompt(date, [server])
+
+    server["tools"][0]["schema"]["required"] = []
+
+    assert generate_mcp_system_prompt(
+        date, [server]
+    ) == baseline_prompt_utils.generate_mcp_system_prompt(date, [server])
+
+
+@pytest.mark.parametrize(
+    "date", [datetime.date(2025, 1, 9), datetime.datetime(999, 12, 31, 23, 59)]
+)
+def test_no_mcp_system_prompt_matches_the_baseline_builder(date):
+    expected = baseline_prompt_utils.generate_no_mcp_system_prompt(date)
+
+    assert generate_no_mcp_system_prompt(date) == expected
+    assert generate_no_mcp_system_prompt(date) == expected
+
+
+def test_refusal_keywords_are_reported_in_declaration_order():
+    text = "I'm sorry, I cannot solve this under the time constraint."
+
+    assert is_refusal(text)
+    assert find_refusal_keywords(text) == [
+        "time constraint",
+        "I'm sorry, I cannot solve",
+    ]
+
+
+@pytest.mark.parametrize("text", ["", "The answer is 42.", "Time constraints aside"])
+def test_non_refusals(text):
+    assert not is_refusal(text)
+    assert find_refusal_keywords(text) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I'm sorry, but I can't help with that.",
+        "I\u2019m sorry, but I can\u2019t help with that.",
+        "I\u2018m sorry, but I can't help with that.",
+    ],
+)
+def test_refusals_match_either_apostrophe(text):
+    assert is_refusal(text)
+    assert find_refusal_keywords(text) == ["I\u2019m sorry, but I can\u2019t"]
+
+
+def test_refusals_with_typographic_apostrophes_report_the_declared_keyword():
+    text = "I\u2019m sorry, I cannot solve this."
+
+    assert find_refusal_keywords(text) == ["I'm sorry, I cannot solve"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["I am sorry, but I can't", "Im sorry, but I cant", "I`m sorry, I cannot solve"],
+)
+def test_other_apostrophes_are_not_refusals(text):
+    assert not is_refusal(text)
+
+
+BROKEN_SERVER = {"name": "broken", "tools": [{"error": "Unable to fetch tools"}]}
+
+
+def test_lazy_mcp_system_prompt_lists_tool_names_and_the_catalog():
+    date = datetime.date(2025, 1, 9)
+    index = (
+        "\n## Server name: search\nTools: google_search\n"
+        "\n## Server name: browser\nTools: scrape\n"
+        "\n## Server name: broken\nTools: \n"
+    )
+    catalog_heading = f"\n## Server name: {TOOL_CATALOG_SERVER_NAME}\n"
+    expected = baseline_prompt_utils.generate_mcp_system_prompt(
+        date, [_TOOL_CATALOG_SERVER]
+    ).replace(catalog_heading, index + catalog_heading, 1)
+
+    prompt = generate_mcp_system_prompt(
+        date, [SEARCH_SERVER, BROWSER_SERVER, BROKEN_SERVER], lazy=True
+    )
+
+    assert prompt == expected
+    assert f"### Tool name: {DESCRIBE_TOOL_NAME}\n" in prompt
+    assert "Search the web." not in prompt
+
+
+def test_describe_tool_renders_the_eager_definition():
+    definition = describe_tool(
+        [SEARCH_SERVER, BROWSER_SERVER], "search", "google_search"
+    )
+
+    assert definition is not None
+    assert definition in render_server_block(SEARCH_SERVER)
+    assert definition.startswith("### Tool name: google_search\n")
+
+
+@pytest.mark.parametrize(
+    "server_name, tool_name",
+    [
+        ("search", "sogou_search"),
+        ("browser", "google_search"),
+        ("unknown", "google_search"),
+        ("broken", "google_search"),
+        ("broken", None),
+    ],
+)
+def test_describe_tool_returns_none_for_unknown_tools(server_name, tool_name):
+    servers = [SEARCH_SERVER, BROWSER_SERVER, BROKEN_SERVER]
+
+    assert describe_tool(servers, server_name, tool_name) is None
@@ -3,37 +3,114 @@
 
 import asyncio
 import functools
-from typing import Any, Awaitable, Callable, Protocol, TypeVar
-
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import threading
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Protocol
+
+from anyio import BrokenResourceError, ClosedResourceError
 from mcp import ClientSession, StdioServerParameters  # (already imported in config.py)
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 
 from .mcp_servers.browser_session import PlaywrightSession
 
 # logger = logging.getLogger("miroflow_agent")
 
-R = TypeVar("R")
+TOOL_CALL_TIMEOUT_S = 1200
+# Idle sessions kept open per server; extra sessions opened for concurrent
+# calls are closed once their call is done
+MAX_IDLE_SESSIONS_PER_SERVER = 8
 
+# Hugging Face dataset and space pages; scraping them could leak benchmark answers
+_HF_DATASET_OR_SPACE_RE = re.compile(r"huggingface\.co/(?:datasets|spaces)")
+_HF_SCRAPING_BLOCKED_MESSAGE = "You are trying to scrape a Hugging Face dataset for answers, please do not use the scrape tool for this purpose."
 
-def with_timeout(timeout_s: float = 300.0):
-    """
-    Decorator: wraps any *async* function in asyncio.wait_for().
-    Usage:
-        @with_timeout(20)
-        async def create_message_foo(...): ...
+
+def _transport_kind(server_params):
+    """Classify server params as "stdio", "sse" (http(s) URL) or None."""
+    if isinstance(server_params, StdioServerParameters):
+        return "stdio"
+    if isinstance(server_params, str) and server_params.startswith(
+        ("http://", "https://")
+    ):
+        return "sse"
+    return None
+
+
+def _discard_log(level, step_name, message, metadata=None):
+    """Logging stand-in used while no task log is set."""
+
+
+def _server_source_path(server_params):
+    """Source file of a stdio server run as `-m module` or as a .py script, if any."""
+    args = list(server_params.args)
+    if "-m" in args:
+        try:
+            return importlib.util.find_spec(args[args.index("-m") + 1]).origin
+        except (IndexError, ImportError, AttributeError, ValueError):
+            return None
+    for arg in args:
+        if arg.endswith(".py"):
+            return os.path.join(getattr(server_params, "cwd", None) or "", arg)
+    return None
+
+
+def _server_source_mtime(server_params):
     """
+    Newest modification time of a stdio server's source, if it has one.
 
-    def decorator(
-        func: Callable[..., Awaitable[R]],
-    ) -> Callable[..., Awaitable[R]]:
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs) -> R:
-            return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout_s)
+    For a server inside a package, every .py file of that package counts, so
+    edits to the helper modules it imports also invalidate cached definitions.
+    """
+    source_path = _server_source_path(server_params)
+    if not source_path:
+        return None
+    source_dir = os.path.dirname(os.path.abspath(source_path))
+    paths = [source_path]
+    if os.path.exists(os.path.join(source_dir, "__init__.py")):
+        paths = glob.glob(
+            os.path.join(glob.escape(source_dir), "**", "*.py"), recursive=True
+        )
+    try:
+        return max(os.path.getmtime(path) for path in paths)
+    except (ValueError, OSError):
+        return None
+
+
+def _run_event_loop(loop):
+    """Thread target: run `loop` until it is stopped, then close it."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def _tool_entries(tools_response):
+    """Convert a list_tools response into the tool dicts used for prompts."""
+    return [
+        {
+            # Names are interned; tool calls are dispatched by comparing them
+            "name": sys.intern(tool.name),
+            "description": tool.description,
+            "schema": tool.inputSchema,
+        }
+        for tool in tools_response.tools
+    ]
 
-        return wrapper
 
-    return decorator
+class _ServerUnavailable(Exception):
+    """The server could not be started, or its process died during a request."""
 
 
 class ToolManagerProtocol(Protocol):
@@ -45,23 +122,86 @@ class ToolManagerProtocol(Protocol):
     ) -> Any: ...
 
 
+@dataclass(slots=True, eq=False)
+class _PooledSession:
+    """An open ClientSession; `task` owns its transport until `stop` is set."""
+
+    session: ClientSession
+    task: asyncio.Task
+    stop: asyncio.Event
+
+
+@dataclass(slots=True)
+class _ServerContext:
+    """Per-server state: launch parameters and the pooled sessions."""
+
+    params: Any
+    # "stdio", "sse" or None for unsupported params; classified once at init
+    kind: str | None
+    # Bound method that executes tool calls for this server, chosen once at init
+    call: Callable[..., Awaitable[dict]]
+    # Sessions waiting for a request, most recently used last
+    idle: list[_PooledSession] = field(default_factory=list)
+    # All open sessions of the server, idle or busy
+    sessions: set[_PooledSession] = field(default_factory=set)
+
+
 class ToolManager(ToolManagerProtocol):
-    def __init__(self, server_configs, tool_blacklist=None):
+    def __init__(self, server_configs, tool_blacklist=None, cache_dir=None):
         """
         Initialize ToolManager.
         :param server_configs: List returned by create_server_parameters()
+        :param tool_blacklist: Set of (server_name, tool_name) pairs to hide
+        :param cache_dir: Directory for cached tool definitions of stdio servers;
+            None (the default) disables the cache
         """
         self.server_configs = server_configs
         self.server_dict = {
             config["name"]: config["params"] for config in server_configs
         }
         self.browser_session = None
-        self.tool_blacklist = tool_blacklist if tool_blacklist else set()
+        self._browser_init_lock = asyncio.Lock()
+        # HTTP session of the MarkItDown scrape fallback, created with it
+        self._fallback_http = None
+        self.tool_blacklist = frozenset(tool_blacklist or ())
+        # Blacklisted tool names per server, so discovery checks one small set
+        blacklist_by_server = {}
+        for server_name, tool_name in self.tool_blacklist:
+            blacklist_by_server.setdefault(server_name, set()).add(tool_name)
+        self._blacklist_by_server = {
+            server_name: frozenset(tool_names)
+            for server_name, tool_names in blacklist_by_server.items()
+        }
         self.task_log = None
+        self._log = _discard_log
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        # Persistent sessions, opened on first use and reused across tool calls.
+        # They live on an event loop of their own, run by a background thread,
+        # so callers on any event loop share them and aclose() works from any loop.
+        self._servers = {
+            name: _ServerContext(
+                params,
+                _transport_kind(params),
+                self._call_playwright if name == "playwright" else self._call_session,
+            )
+            for name, params in self.server_dict.items()
+        }
+        self._pool_loop = None
+        self._pool_loop_lock = threading.Lock()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     def set_task_log(self, task_log):
         """Set the task logger for structured logging."""
         self.task_log = task_log
+        # _log(level, step_name, message, metadata=None) goes straight to the
+        # task log, or to a no-op without one
+        self._log = task_log.log_step if task_log else _discard_log
 
         self._log(
             "info",
@@ -69,20 +209,15 @@ class ToolManager(ToolManagerProtocol):
             f"ToolManager initialized, loaded servers: {list(self.server_dict.keys())}",
         )
 
-    def _log(self, level, step_name, message, metadata=None):
-        """Helper method to log using task_log if available, otherwise skip logging."""
-        if self.task_log:
-            self.task_log.log_step(level, step_name, message, metadata)
-
     def _is_huggingface_dataset_or_space_url(self, url):
         """
         Check if the URL is a Hugging Face dataset or space URL.
         :param url: The URL to check
         :return: True if it's a HuggingFace dataset or space URL, False otherwise
         """
-        if not url:
+        if not url or not isinstance(url, str):
             return False
-        return "huggingface.co/datasets" in url or "huggingface.co/spaces" in url
+        return _HF_DATASET_OR_SPACE_RE.search(url) is not None
 
     def _should_block_hf_scraping(self, tool_name, arguments):
         """
@@ -97,104 +232,392 @@ class ToolManager(ToolManagerProtocol):
             and self._is_huggingface_dataset_or_space_url(arguments["url"])
         )
 
+    @functools.cached_property
+    def _markitdown(self):
+        """
+        MarkItDown converter for the scrape fallback, created on first use.
+
+        Pages are fetched through one pooled requests.Session, so repeated
+        fallbacks to the same host reuse their keep-alive connections.
+        """
+        # Imported here so that markitdown stays an optional dependency
+        import requests
+        from markitdown import MarkItDown
+        from requests.adapters import HTTPAdapter
+
+        http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+        http.mount("http://", adapter)
+        http.mount("https://", adapter)
+        self._fallback_http = http
+        return MarkItDown(
+            docintel_endpoint="<document_intelligence_endpoint>",
+            requests_session=http,
+        )
+
     def get_server_params(self, server_name):
         """Get parameters for the specified server"""
         return self.server_dict.get(server_name)
 
-    async def get_all_tool_definitions(self):
+    async def _open_session(self, ctx, stack):
         """
-        Connect to all configured servers and get their tool definitions.
-        Returns a list suitable for passing to the Prompt generator.
+        Open a transport and an initialized ClientSession for a server.
+
+        Both contexts are entered on `stack`; closing the stack closes them.
         """
-        all_servers_for_prompt = []
-        # Process remote server tools
-        for config in self.server_configs:
-            server_name = config["name"]
-            server_params = config["params"]
-            one_server_for_prompt = {"name": server_name, "tools": []}
+        if ctx.kind == "stdio":
+            client = stdio_client(ctx.params)
+        elif ctx.kind == "sse":
+            client = sse_client(ctx.params)
+        else:
+            raise TypeError(f"Unknown server params type: {type(ctx.params)}")
+        read, write = await stack.enter_async_context(client)
+        session = await stack.enter_async_context(
+            ClientSession(read, write, sampling_callback=None)
+        )
+        await session.initialize()
+        return session
+
+    async def _hold_session(self, ctx, ready, stop):
+        """
+        Open a session, hand it over through `ready` and keep it open until `stop` is set.
+
+        The transport contexts (anyio task groups) must be exited by the task
+        that entered them, so every pooled session lives in its own task.
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                session = await self._open_session(ctx, stack)
+                ready.set_result(session)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                self._log(
+                    "warning",
+                    "ToolManager | Session Closed",
+                    f"Persistent session ended with an error: {e}",
+                )
+
+    def _ensure_pool_loop(self):
+        """Return the event loop holding the pooled sessions, starting it if needed."""
+        with self._pool_loop_lock:
+            if self._pool_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=_run_event_loop,
+                    args=(loop,),
+                    name="ToolManager-sessions",
+                    daemon=True,
+                ).start()
+                self._pool_loop = loop
+            return self._pool_loop
+
+    async def _in_pool(self, coro):
+        """Run a coroutine on the session loop and wait for it from the calling loop."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_pool_loop())
+        # Cancelling the wrapper (e.g. on timeout) cancels the coroutine too
+        return await asyncio.wrap_future(future)
+
+    async def _acquire(self, ctx):
+        """
+        Take an idle session of a server, or open a new one (session loop only).
+
+        A session serves one request at a time, so tools that block their
+        server's event loop do not hold up concurrent calls.
+
+        :raises _ServerUnavailable: If no session could be opened
+        """
+        while ctx.idle:
+            pooled = ctx.idle.pop()
+            if not pooled.task.done():
+                return pooled
+
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._hold_session(ctx, ready, stop))
+        try:
+            session = await ready
+        except asyncio.CancelledError:
+            # e.g. the tool call timed out while connecting
+            task.cancel()
+            raise
+        except Exception as e:
+            raise _ServerUnavailable(str(e) or repr(e)) from e
+        pooled = _PooledSession(session, task, stop)
+        ctx.sessions.add(pooled)
+        task.add_done_callback(lambda _: ctx.sessions.discard(pooled))
+        return pooled
+
+    def _release(self, ctx, pooled):
+        """Return a session to the idle list, or close it if enough are idle."""
+        if len(ctx.idle) < MAX_IDLE_SESSIONS_PER_SERVER and not pooled.task.done():
+            ctx.idle.append(pooled)
+        else:
+            pooled.stop.set()
+
+    async def _request(self, ctx, method, *args, **kwargs):
+        """
+        Send a request on a pooled session of the server (session loop only).
+
+        :param method: ClientSession method, e.g. ClientSession.call_tool
+        :raises _ServerUnavailable: If no session could be opened, or the
+            connection was lost before the server answered
+        """
+        for attempt in range(2):
+            pooled = await self._acquire(ctx)
+            reusable = False
+            try:
+                result = await method(pooled.session, *args, **kwargs)
+                reusable = True
+                return result
+            except (ClosedResourceError, BrokenResourceError) as e:
+                # The server exited while the session was idle and the
+                # request was never sent: retry once on a new session
+                if attempt:
+                    raise _ServerUnavailable("Connection closed") from e
+            except McpError as e:
+                if e.error.code == CONNECTION_CLOSED:
+                    raise _ServerUnavailable("Connection closed") from e
+                # Errors reported by the server leave the session usable
+                reusable = True
+                raise
+            finally:
+                # Cancelled requests may still be running in the server
+                if reusable:
+                    self._release(ctx, pooled)
+                else:
+                    pooled.stop.set()
+
+    async def _open_idle_session(self, ctx):
+        """Make sure a server has an idle session (session loop only)."""
+        self._release(ctx, await self._acquire(ctx))
+
+    async def _connect_one(self, server_name, ctx):
+        try:
+            await self._in_pool(self._open_idle_session(ctx))
+        except Exception as e:
             self._log(
-                "info",
-                "ToolManager | Get Tool Definitions",
-                f"Getting tool definitions for server '{server_name}'...",
+                "error",
+                "ToolManager | Connection Error",
+                f"Error: Unable to connect to server '{server_name}': {e}",
+            )
+
+    async def connect(self):
+        """
+        Open persistent sessions to all configured servers, concurrently.
+
+        Optional: sessions are otherwise opened on first use. Servers that fail
+        to connect are logged and retried on their next tool call.
+        """
+        await asyncio.gather(
+            *(
+                self._connect_one(server_name, ctx)
+                for server_name, ctx in self._servers.items()
+                if server_name != "playwright"
             )
+        )
+
+    async def aclose(self):
+        """
+        Close all persistent sessions, the browser and the fallback HTTP session.
 
+        Can be called from any event loop; the sessions are closed on their own
+        loop, which is then stopped. Later calls open new sessions.
+        """
+        with self._pool_loop_lock:
+            loop, self._pool_loop = self._pool_loop, None
+        if loop is not None:
             try:
-                if isinstance(server_params, StdioServerParameters):
-                    async with stdio_client(server_params) as (read, write):
-                        async with ClientSession(
-                            read, write, sampling_callback=None
-                        ) as session:
-                            await session.initialize()
-                            tools_response = await session.list_tools()
-                            # black list some tools
-                            for tool in tools_response.tools:
-                                if (server_name, tool.name) in self.tool_blacklist:
-                                    self._log(
-                                        "info",
-                                        "ToolManager | Tool Blacklisted",
-                                        f"Tool '{tool.name}' in server '{server_name}' is blacklisted, skipping.",
-                                    )
-                                    continue
-                                one_server_for_prompt["tools"].append(
-                                    {
-                                        "name": tool.name,
-                                        "description": tool.description,
-                                        "schema": tool.inputSchema,
-                                    }
-                                )
-                elif isinstance(server_params, str) and server_params.startswith(
-                    ("http://", "https://")
-                ):
-                    # SSE endpoint
-                    async with sse_client(server_params) as (read, write):
-                        async with ClientSession(
-                            read, write, sampling_callback=None
-                        ) as session:
-                            await session.initialize()
-                            tools_response = await session.list_tools()
-                            for tool in tools_response.tools:
-                                # Can add specific tool filtering logic here (if needed)
-                                # if server_name == "tool-excel" and tool.name not in ["get_workbook_metadata", "read_data_from_excel"]:
-                                #     continue
-                                one_server_for_prompt["tools"].append(
-                                    {
-                                        "name": tool.name,
-                                        "description": tool.description,
-                                        "schema": tool.inputSchema,
-                                    }
-                                )
-                else:
-                    self._log(
-                        "error",
-                        "ToolManager | Unknown Parameter Type",
-                        f"Error: Unknown parameter type for server '{server_name}': {type(server_params)}",
-                    )
-                    raise TypeError(
-                        f"Unknown server params type for {server_name}: {type(server_params)}"
-                    )
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(self._close_sessions(), loop)
+                )
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+
+        if self._fallback_http is not None:
+            self._fallback_http.close()
+            self._fallback_http = None
+            self.__dict__.pop("_markitdown", None)
+
+    async def _close_sessions(self):
+        """Close the pooled sessions and the browser (session loop only)."""
+        open_sessions = [
+            pooled for ctx in self._servers.values() for pooled in ctx.sessions
+        ]
+        for pooled in open_sessions:
+            pooled.stop.set()
+        await asyncio.gather(
+            *(pooled.task for pooled in open_sessions), return_exceptions=True
+        )
+        for ctx in self._servers.values():
+            ctx.idle.clear()
+        # Locks bind to the loop they are first used on; the next one is new
+        self._browser_init_lock = asyncio.Lock()
 
+        if self.browser_session is not None:
+            browser_session, self.browser_session = self.browser_session, None
+            try:
+                await browser_session.close()
+            except Exception as e:
                 self._log(
-                    "info",
-                    "ToolManager | Tool Definitions Success",
-                    f"Successfully obtained {len(one_server_for_prompt['tools'])} tool definitions from server '{server_name}'.",
+                    "warning",
+                    "ToolManager | Browser Close Error",
+                    f"Error closing Playwright session: {e}",
                 )
-                all_servers_for_prompt.append(one_server_for_prompt)
 
-            except Exception as e:
+    def _definitions_cache_path(self, server_name, server_params):
+        """
+        Cache file for a stdio server's tool definitions.
+
+        The key covers the launch command, its environment and the newest
+        mtime of the server's source directory. Servers without a local source
+        file (e.g. launched through npx) are keyed on their launch command only.
+        """
+        key_source = json.dumps(
+            {
+                "name": server_name,
+                "command": server_params.command,
+                "args": list(server_params.args),
+                "env": server_params.env,
+                "cwd": getattr(server_params, "cwd", None),
+                "source_mtime": _server_source_mtime(server_params),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"tools_{server_name}_{key}.json")
+
+    def _load_cached_definitions(self, server_name, server_params):
+        """Return cached tool definitions of a stdio server, or None on a miss."""
+        if not self.cache_dir:
+            return None
+        path = self._definitions_cache_path(server_name, server_params)
+        try:
+            with open(path, encoding="utf-8") as f:
+                tools = json.load(f)
+        except (OSError, ValueError):
+            return None
+        for tool in tools:
+            tool["name"] = sys.intern(tool["name"])
+        self._log(
+            "info",
+            "ToolManager | Tool Definitions Cache Hit",
+            f"Loaded {len(tools)} tool definitions for server '{server_name}' from {path}",
+        )
+        return tools
+
+    def _store_cached_definitions(self, server_name, server_params, tools):
+        """Write tool definitions to the cache and drop stale entries of the server."""
+        if not self.cache_dir:
+            return
+        path = self._definitions_cache_path(server_name, server_params)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pattern = f"tools_{glob.escape(server_name)}_*.json"
+            for stale in glob.glob(os.path.join(glob.escape(self.cache_dir), pattern)):
+                if stale != path:
+                    os.remove(stale)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(tools, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self._log(
+                "warning",
+                "ToolManager | Tool Definitions Cache Error",
+                f"Unable to cache tool definitions for server '{server_name}': {e}",
+            )
+
+    async def _discover_one(self, config):
+        """
+        Connect to one server and get its tool definitions.
+
+        Errors are reported in the returned entry instead of being raised.
+        """
+        server_name = sys.intern(config["name"])
+        server_params = config["params"]
+        ctx = self._servers[server_name]
+        one_server_for_prompt = {"name": server_name, "tools": []}
+        self._log(
+            "info",
+            "ToolManager | Get Tool Definitions",
+            f"Getting tool definitions for server '{server_name}'...",
+        )
+
+        try:
+            tools = None
+            if ctx.kind == "stdio":
+                tools = self._load_cached_definitions(server_name, server_params)
+            if tools is None:
+                if server_name == "playwright":
+                    # Its calls go through PlaywrightSession; don't pool a second one
+                    async with AsyncExitStack() as stack:
+                        session = await self._open_session(ctx, stack)
+                        tools_response = await session.list_tools()
+                else:
+                    # List on the pooled session, which later tool calls reuse
+                    tools_response = await self._in_pool(
+                        self._request(ctx, ClientSession.list_tools)
+                    )
+                tools = _tool_entries(tools_response)
+                if ctx.kind == "stdio":
+                    self._store_cached_definitions(server_name, server_params, tools)
+
+            # black list some tools
+            blacklisted = self._blacklist_by_server.get(server_name, frozenset())
+            one_server_for_prompt["tools"] = [
+                tool for tool in tools if tool["name"] not in blacklisted
+            ]
+            if len(one_server_for_prompt["tools"]) < len(tools):
                 self._log(
-                    "error",
-                    "ToolManager | Connection Error",
-                    f"Error: Unable to connect or get tools from server '{server_name}': {e}",
+                    "info",
+                    "ToolManager | Tool Blacklisted",
+                    f"Tools {sorted(blacklisted)} in server '{server_name}' are blacklisted, skipping.",
                 )
-                # Still add server entry, but mark tool list as empty or include error information
-                one_server_for_prompt["tools"] = [
-                    {"error": f"Unable to fetch tools: {e}"}
-                ]
-                all_servers_for_prompt.append(one_server_for_prompt)
 
+            self._log(
+                "info",
+                "ToolManager | Tool Definitions Success",
+                f"Successfully obtained {len(one_server_for_prompt['tools'])} tool definitions from server '{server_name}'.",
+            )
+            return one_server_for_prompt
+
+        except Exception as e:
+            self._log(
+                "error",
+                "ToolManager | Connection Error",
+                f"Error: Unable to connect or get tools from server '{server_name}': {e}",
+            )
+            # Still add server entry, but mark tool list as empty or include error information
+            one_server_for_prompt["tools"] = [
+                {"error": f"Unable to fetch tools: {e}"}
+            ]
+            return one_server_for_prompt
+
+    async def get_all_tool_definitions(self):
+        """
+        Connect to all configured servers and get their tool definitions.
+        Returns a list suitable for passing to the Prompt generator.
+
+        Servers are queried concurrently; the result keeps the configured order.
+        """
+        results = await asyncio.gather(
+            *(self._discover_one(config) for config in self.server_configs),
+            return_exceptions=True,
+        )
+        all_servers_for_prompt = []
+        for config, result in zip(self.server_configs, results):
+            if isinstance(result, BaseException):
+                result = {
+                    "name": config["name"],
+                    "tools": [{"error": f"Unable to fetch tools: {result}"}],
+                }
+            all_servers_for_prompt.append(result)
         return all_servers_for_prompt
 
-    @with_timeout(1200)
     async def execute_tool_call(self, server_name, tool_name, arguments) -> Any:
         """
         Execute a single tool call.
@@ -202,11 +625,17 @@ class ToolManager(ToolManagerProtocol):
         :param tool_name: Tool name
         :param arguments: Tool arguments dictionary
         :return: Dictionary containing result or error
+        :raises TimeoutError: If the call takes longer than TOOL_CALL_TIMEOUT_S
         """
+        # Cancels the current task on expiry; no wrapper task as with wait_for()
+        async with asyncio.timeout(TOOL_CALL_TIMEOUT_S):
+            return await self._execute_tool_call(server_name, tool_name, arguments)
 
-        # Original remote server call logic
-        server_params = self.get_server_params(server_name)
-        if not server_params:
+    async def _execute_tool_call(self, server_name, tool_name, arguments):
+
+        # One lookup yields the server's params and its pooled session
+        ctx = self._servers.get(server_name)
+        if ctx is None or not ctx.params:
             self._log(
                 "error",
                 "ToolManager | Server Not Found",
@@ -218,166 +647,153 @@ class ToolManager(ToolManagerProtocol):
                 "error": f"Server '{server_name}' not found.",
             }
 
-        self._log(
-            "info",
-            "ToolManager | Tool Call Start",
-            f"Connecting to server '{server_name}' to call tool '{tool_name}'",
-            metadata={"arguments": arguments},
-        )
+        # Block the browsing agent from reading answers from hf datasets,
+        # before any page is fetched
+        if self._should_block_hf_scraping(tool_name, arguments):
+            self._log(
+                "info",
+                "ToolManager | Tool Call Blocked",
+                f"Blocked '{tool_name}' on a Hugging Face dataset/space URL",
+            )
+            return {
+                "server_name": server_name,
+                "tool_name": tool_name,
+                "result": _HF_SCRAPING_BLOCKED_MESSAGE,
+            }
 
-        if server_name == "playwright":
-            try:
+        if self.task_log:
+            self._log(
+                "info",
+                "ToolManager | Tool Call Start",
+                f"Connecting to server '{server_name}' to call tool '{tool_name}'",
+                metadata={"arguments": arguments},
+            )
+
+        return await ctx.call(ctx, server_name, tool_name, arguments)
+
+    async def _browser_call(self, ctx, tool_name, arguments):
+        """Call a tool on the persistent Playwright browser session (session loop only)."""
+        if self.browser_session is None:
+            # Concurrent first calls must not launch two browsers
+            async with self._browser_init_lock:
                 if self.browser_session is None:
-                    self.browser_session = PlaywrightSession(server_params)
-                    await self.browser_session.connect()
-                tool_result = await self.browser_session.call_tool(
-                    tool_name, arguments=arguments
+                    browser_session = PlaywrightSession(ctx.params)
+                    await browser_session.connect()
+                    self.browser_session = browser_session
+        return await self.browser_session.call_tool(tool_name, arguments=arguments)
+
+    async def _call_playwright(self, ctx, server_name, tool_name, arguments):
+        """Call a tool on the persistent Playwright browser session."""
+        try:
+            tool_result = await self._in_pool(
+                self._browser_call(ctx, tool_name, arguments)
+            )
+            return {
+                "server_name": server_name,
+                "tool_name": tool_name,
+                "result": tool_result,
+            }
+        except Exception as e:
+            return {
+                "server_name": server_name,
+                "tool_name": tool_name,
+                "error": "Tool call failed: " + str(e),
+            }
+
+    async def _call_session(self, ctx, server_name, tool_name, arguments):
+        """Call a tool on the server's pooled MCP session (stdio or SSE)."""
+        try:
+            try:
+                tool_result = await self._in_pool(
+                    self._request(
+                        ctx, ClientSession.call_tool, tool_name, arguments=arguments
+                    )
+                )
+                # Extract result content - preserve full JSON for search tools
+                if tool_result.content:
+                    result_content = tool_result.content[-1].text
+                else:
+                    result_content = ""
+            except _ServerUnavailable:
+                raise
+            except Exception as tool_error:
+                # Format the error once for both the log and the result
+                error_message = str(tool_error) or repr(tool_error)
+                self._log(
+                    "error",
+                    "ToolManager | Tool Execution Error",
+                    "Tool execution error: " + error_message,
                 )
                 return {
                     "server_name": server_name,
                     "tool_name": tool_name,
-                    "result": tool_result,
-                }
-            except Exception as e:
-                return {
-                    "server_name": server_name,
-                    "tool_name": tool_name,
-                    "error": f"Tool call failed: {str(e)}",
+                    "error": "Tool execution failed: " + error_message,
                 }
-        else:
-            try:
-                result_content = None
-                if isinstance(server_params, StdioServerParameters):
-                    async with stdio_client(server_params) as (read, write):
-                        async with ClientSession(
-                            read, write, sampling_callback=None
-                        ) as session:
-                            await session.initialize()
-                            try:
-                                tool_result = await session.call_tool(
-                                    tool_name, arguments=arguments
-                                )
-                                # Extract result content
-                                if tool_result.content:
-                                    result_content = tool_result.content[-1].text
-                                else:
-                                    result_content = ""
-                                
-                                # post hoc check for browsing agent reading answers from hf datsets
-                                if self._should_block_hf_scraping(tool_name, arguments):
-                                    result_content = "You are trying to scrape a Hugging Face dataset for answers, please do not use the scrape tool for this purpose."
-                            except Exception as tool_error:
-                                self._log(
-                                    "error",
-                                    "ToolManager | Tool Execution Error",
-                                    f"Tool execution error: {tool_error}",
-                                )
-                                return {
-                                    "server_name": server_name,
-                                    "tool_name": tool_name,
-                                    "error": f"Tool execution failed: {str(tool_error)}",
-                                }
-                elif isinstance(server_params, str) and server_params.startswith(
-                    ("http://", "https://")
-                ):
-                    async with sse_client(server_params) as (read, write):
-                        async with ClientSession(
-                            read, write, sampling_callback=None
-                        ) as session:
-                            await session.initialize()
-                            try:
-                                tool_result = await session.call_tool(
-                                    tool_name, arguments=arguments
-                                )
-                                # Extract result content - preserve full JSON for search tools
-                                if tool_result.content:
-                                    result_content = tool_result.content[-1].text
-                                else:
-                                    result_content = ""
-                                
-                                # post hoc check for browsing agent reading answers from hf datsets
-                                if self._should_block_hf_scraping(tool_name, arguments):
-                                    result_content = "You are trying to scrape a Hugging Face dataset for answers, please do not use the scrape tool for this purpose."
-                            except Exception as tool_error:
-                                self._log(
-                                    "error",
-                                    "ToolManager | Tool Execution Error",
-                                    f"Tool execution error: {tool_error}",
-                                )
-                                return {
-                                    "server_name": server_name,
-                                    "tool_name": tool_name,
-                                    "error": f"Tool execution failed: {str(tool_error)}",
-                                }
-                else:
-                    raise TypeError(
-                        f"Unknown server params type for {server_name}: {type(server_params)}"
-                    )
 
+            if self.task_log:
                 self._log(
                     "info",
                     "ToolManager | Tool Call Success",
                     f"Tool '{tool_name}' (server: '{server_name}') called successfully.",
                 )
 
-                return {
-                    "server_name": server_name,
-                    "tool_name": tool_name,
-                    "result": result_content,  # Return extracted text content
-                }
+            return {
+                "server_name": server_name,
+                "tool_name": tool_name,
+                "result": result_content,  # Return extracted text content
+            }
 
-            except Exception as outer_e:  # Rename this to outer_e to avoid shadowing
-                self._log(
-                    "error",
-                    "ToolManager | Tool Call Failed",
-                    f"Error: Failed to call tool '{tool_name}' (server: '{server_name}'): {outer_e}",
-                )
+        except Exception as outer_e:  # Rename this to outer_e to avoid shadowing
+            # Store the original error message for later use
+            error_message = str(outer_e)
+            self._log(
+                "error",
+                "ToolManager | Tool Call Failed",
+                f"Error: Failed to call tool '{tool_name}' (server: '{server_name}'): {error_message}",
+            )
 
-                # Store the original error message for later use
-                error_message = str(outer_e)
-
-                if (
-                    tool_name in ["scrape", "scrape_website"]
-                    and "unhandled errors" in error_message
-                    and "url" in arguments
-                    and arguments["url"] is not None
-                ):
-                    try:
-                        self._log(
-                            "info",
-                            "ToolManager | Fallback Attempt",
-                            "Attempting fallback using MarkItDown...",
-                        )
-                        from markitdown import MarkItDown
-
-                        md = MarkItDown(
-                            docintel_endpoint="<document_intelligence_endpoint>"
-                        )
-                        result = md.convert(arguments["url"])
-                        self._log(
-                            "info",
-                            "ToolManager | Fallback Success",
-                            "MarkItDown fallback successful",
-                        )
-                        return {
-                            "server_name": server_name,
-                            "tool_name": tool_name,
-                            "result": result.text_content,  # Return extracted text content
-                        }
-                    except (
-                        Exception
-                    ) as inner_e:  # Use a different name to avoid shadowing
-                        # Log the inner exception if needed
-                        self._log(
-                            "error",
-                            "ToolManager | Fallback Failed",
-                            f"Fallback also failed: {inner_e}",
-                        )
-                        # No need for pass here as we'll continue to the return statement
-
-                # Always use the outer exception for the final error response
-                return {
-                    "server_name": server_name,
-                    "tool_name": tool_name,
-                    "error": f"Tool call failed: {error_message}",
-                }
+            # The scraper's process failed to start or died during the call
+            if (
+                tool_name in ["scrape", "scrape_website"]
+                and isinstance(outer_e, _ServerUnavailable)
+                and "url" in arguments
+                and arguments["url"] is not None
+            ):
+                try:
+                    self._log(
+                        "info",
+                        "ToolManager | Fallback Attempt",
+                        "Attempting fallback using MarkItDown...",
+                    )
+                    # convert() fetches and parses synchronously; keep it
+                    # off the event loop
+                    result = await asyncio.to_thread(
+                        self._markitdown.convert, arguments["url"]
+                    )
+                    self._log(
+                        "info",
+                        "ToolManager | Fallback Success",
+                        "MarkItDown fallback successful",
+                    )
+                    return {
+                        "server_name": server_name,
+                        "tool_name": tool_name,
+                        "result": result.text_content,  # Return extracted text content
+                    }
+                except (
+                    Exception
+                ) as inner_e:  # Use a different name to avoid shadowing
+                    # Log the inner exception if needed
+                    self._log(
+                        "error",
+                        "ToolManager | Fallback Failed",
+                        f"Fallback also failed: {inner_e}",
+                    )
+                    # No need for pass here as we'll continue to the return statement
+
+            # Always use the outer exception for the final error response
+            return {
+                "server_name": server_name,
+                "tool_name": tool_name,
+                "error": "Tool call failed: " + error_message,
+            }
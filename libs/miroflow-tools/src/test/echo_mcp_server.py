@@ -0,0 +1,40 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+"""Minimal stdio MCP server used by the ToolManager tests."""
+
+import os
+import time
+
+from fastmcp import FastMCP
+
+mcp = FastMCP("echo-mcp-server")
+
+
+@mcp.tool()
+async def echo(text: str) -> str:
+    """Return the given text unchanged."""
+    return text
+
+
+@mcp.tool()
+async def get_pid() -> str:
+    """Return the process id of this server."""
+    return str(os.getpid())
+
+
+@mcp.tool()
+def blocking_sleep(seconds: float) -> str:
+    """Block the server's event loop for the given number of seconds."""
+    time.sleep(seconds)
+    return str(os.getpid())
+
+
+@mcp.tool()
+async def scrape(url: str) -> str:
+    """Exit without answering, like a scraper that crashes on a page."""
+    os._exit(1)
+
+
+if __name__ == "__main__":
+    mcp.run(transport="stdio")
@@ -0,0 +1,209 @@
+# Copyright (c) 2025 MiroMind
+# This source code is licensed under the MIT License.
+
+import asyncio
+import json
+import os
+import shutil
+import signal
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from mcp import StdioServerParameters
+
+from miroflow_tools.manager import ToolManager
+
+ECHO_SERVER = Path(__file__).parent / "echo_mcp_server.py"
+
+
+def make_tool_manager(server=ECHO_SERVER, **kwargs):
+    params = StdioServerParameters(command=sys.executable, args=[str(server)])
+    return ToolManager([{"name": "echo", "params": params}], **kwargs)
+
+
+def is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+async def get_server_pid(tool_manager):
+    result = await tool_manager.execute_tool_call(
+        server_name="echo", tool_name="get_pid", arguments={}
+    )
+    assert "error" not in result, result
+    return int(result["result"])
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_across_calls():
+    async with make_tool_manager() as tool_manager:
+        first_pid = await get_server_pid(tool_manager)
+        assert await get_server_pid(tool_manager) == first_pid
+
+
+@pytest.mark.asyncio
+async def test_call_after_server_crash_reconnects():
+    async with make_tool_manager() as tool_manager:
+        crashed_pid = await get_server_pid(tool_manager)
+        os.kill(crashed_pid, signal.SIGKILL)
+        # Crash between calls: let the client read EOF from the dead process
+        await asyncio.sleep(1)
+
+        result = await tool_manager.execute_tool_call(
+            server_name="echo", tool_name="echo", arguments={"text": "hello"}
+        )
+
+        assert result == {
+            "server_name": "echo",
+            "tool_name": "echo",
+            "result": "hello",
+        }
+        assert await get_server_pid(tool_manager) != crashed_pid
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_do_not_share_a_blocked_server():
+    async with make_tool_manager() as tool_manager:
+        results = await asyncio.gather(
+            *(
+                tool_manager.execute_tool_call(
+                    server_name="echo",
+                    tool_name="blocking_sleep",
+                    arguments={"seconds": 0.5},
+                )
+                for _ in range(3)
+            )
+        )
+        pids = {result["result"] for result in results}
+        assert len(pids) == 3
+
+        # Finished sessions stay open for the next calls
+        assert str(await get_server_pid(tool_manager)) in pids
+
+
+class FakeMarkItDown:
+    def __init__(self):
+        self.urls = []
+
+    def convert(self, url):
+        self.urls.append(url)
+        return SimpleNamespace(text_content=f"markdown of {url}")
+
+
+@pytest.mark.asyncio
+async def test_scrape_falls_back_to_markitdown_when_server_dies():
+    async with make_tool_manager() as tool_manager:
+        markitdown = FakeMarkItDown()
+        tool_manager._markitdown = markitdown
+
+        result = await tool_manager.execute_tool_call(
+            server_name="echo",
+            tool_name="scrape",
+            arguments={"url": "https://example.com"},
+        )
+
+        assert result["result"] == "markdown of https://example.com"
+        assert markitdown.urls == ["https://example.com"]
+        # The dead session is not handed to the next call
+        assert await get_server_pid(tool_manager)
+
+
+def test_sessions_outlive_caller_event_loops():
+    tool_manager = make_tool_manager()
+    try:
+        # Like the API server and benchmarks: each run gets a new event loop,
+        # which is closed afterwards
+        first_pid = asyncio.run(get_server_pid(tool_manager))
+        assert asyncio.run(get_server_pid(tool_manager)) == first_pid
+    finally:
+        asyncio.run(tool_manager.aclose())
+    assert not is_process_alive(first_pid)
+
+
+def test_aclose_from_another_thread_stops_servers():
+    tool_manager = make_tool_manager()
+    pid = asyncio.run(get_server_pid(tool_manager))
+
+    # e.g. api-server shutdown, on a different loop than the requests
+    closer = threading.Thread(target=asyncio.run, args=(tool_manager.aclose(),))
+    closer.start()
+    closer.join()
+
+    assert not is_process_alive(pid)
+    # Later calls start new sessions
+    try:
+        assert asyncio.run(get_server_pid(tool_manager)) != pid
+    finally:
+        asyncio.run(tool_manager.aclose())
+
+
+async def get_echo_description(server, cache_dir):
+    async with make_tool_manager(server, cache_dir=str(cache_dir)) as tool_manager:
+        (server_entry,) = await tool_manager.get_all_tool_definitions()
+    return {tool["name"]: tool["description"] for tool in server_entry["tools"]}["echo"]
+
+
+def overwrite_cached_descriptions(cache_dir, description):
+    (cache_file,) = cache_dir.glob("tools_echo_*.json")
+    tools = json.loads(cache_file.read_text())
+    for tool in tools:
+        tool["description"] = description
+    cache_file.write_text(json.dumps(tools))
+
+
+def touch(path):
+    mtime = os.path.getmtime(path) + 10
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_definitions_are_reused(tmp_path):
+    cache_dir = tmp_path / "cache"
+    assert await get_echo_description(ECHO_SERVER, cache_dir) == (
+        "Return the given text unchanged."
+    )
+
+    overwrite_cached_descriptions(cache_dir, "from cache")
+    assert await get_echo_description(ECHO_SERVER, cache_dir) == "from cache"
+
+
+@pytest.mark.asyncio
+async def test_editing_a_server_script_invalidates_the_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    server = tmp_path / "echo_mcp_server.py"
+    shutil.copy(ECHO_SERVER, server)
+    await get_echo_description(server, cache_dir)
+    overwrite_cached_descriptions(cache_dir, "from cache")
+
+    touch(server)
+
+    assert await get_echo_description(server, cache_dir) == (
+        "Return the given text unchanged."
+    )
+
+
+@pytest.mark.asyncio
+async def test_editing_a_server_package_module_invalidates_the_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    package = tmp_path / "servers"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "utils").mkdir()
+    helper = package / "utils" / "helpers.py"
+    helper.write_text("")
+    server = package / "echo_mcp_server.py"
+    shutil.copy(ECHO_SERVER, server)
+    await get_echo_description(server, cache_dir)
+    overwrite_cached_descriptions(cache_dir, "from cache")
+
+    touch(helper)
+
+    assert await get_echo_description(server, cache_dir) == (
+        "Return the given text unchanged."
+    )